@@ -1,4 +1,3 @@
-import hashlib
 import hmac
 import urllib.parse
 
@@ -88,11 +87,9 @@ def join_params(params):
 
 
 def calculate_signature(signing_key, source_string):
-    return hmac.new(
-        key=signing_key.encode("utf-8"),
-        msg=source_string.encode("utf-8"),
-        digestmod=hashlib.sha256,
-    ).hexdigest()
+    return hmac.digest(
+        signing_key.encode("utf-8"), source_string.encode("utf-8"), "sha256"
+    ).hex()
 
 
 def compare_signatures(first, second):
@@ -43,6 +43,13 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture
+def authenticated_api_client(api_client, user):
+    api_client.force_authenticate(user=user)
+    yield api_client
+    api_client.force_authenticate(user=None)
+
+
 @register
 class DataSourceFactory(factory.django.DjangoModelFactory):
     name = factory.LazyAttribute(
@@ -168,6 +175,18 @@ class SignedAuthKeyFactory(factory.django.DjangoModelFactory):
         model = SignedAuthKey
 
 
+@pytest.fixture
+def resource_organization(resource, organization_factory, data_source):
+    organization = organization_factory(
+        origin_id=12345,
+        data_source=data_source,
+        name="Test organization",
+    )
+    resource.organization = organization
+    resource.save(update_fields=["organization"])
+    return organization
+
+
 @pytest.fixture
 def hsa_params_factory():
     def _make_hsa_params(
@@ -1,12 +1,82 @@
-import json
 import urllib.parse
 
 import pytest
-from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 
-from hours.models import DatePeriod, Resource, Rule, TimeSpan
+from hours.models import DatePeriod, Resource
 from hours.permissions import filter_queryset_by_permission
+from hours.tests.utils import assert_response_status_code
+
+RESOURCE_LIST_URL = reverse("resource-list")
+DATE_PERIOD_LIST_URL = reverse("date_period-list")
+RULE_LIST_URL = reverse("rule-list")
+TIME_SPAN_LIST_URL = reverse("time_span-list")
+
+NEW_NAME_JSON = b'{"name": "New name"}'
+
+# The combinations of signed auth params used by the HSA permission tests as
+# (set_hsa_organization, set_hsa_resource, has_organization_rights,
+# should_succeed). The rows marked slow repeat an outcome that is already
+# covered by an unmarked row, and can be skipped with `pytest -m "not slow"`.
+HSA_PERMISSION_CASES = [
+    (False, False, None, False),
+    pytest.param(False, False, True, False, marks=pytest.mark.slow),
+    pytest.param(False, False, False, False, marks=pytest.mark.slow),
+    pytest.param(True, False, None, False, marks=pytest.mark.slow),
+    (True, False, True, True),
+    (True, False, False, False),
+    (False, True, None, True),
+    pytest.param(False, True, True, True, marks=pytest.mark.slow),
+    pytest.param(False, True, False, True, marks=pytest.mark.slow),
+    pytest.param(True, True, None, True, marks=pytest.mark.slow),
+    pytest.param(True, True, True, True, marks=pytest.mark.slow),
+    (True, True, False, True),
+]
+
+# Same as above for operations where the signed resource alone doesn't grant
+# the permission and the organization rights are required.
+HSA_ORGANIZATION_RIGHTS_ONLY_CASES = [
+    (False, False, None, False),
+    pytest.param(False, False, True, False, marks=pytest.mark.slow),
+    pytest.param(False, False, False, False, marks=pytest.mark.slow),
+    pytest.param(True, False, None, False, marks=pytest.mark.slow),
+    (True, False, True, True),
+    (True, False, False, False),
+    (False, True, None, False),
+    pytest.param(False, True, True, False, marks=pytest.mark.slow),
+    pytest.param(False, True, False, False, marks=pytest.mark.slow),
+    pytest.param(True, True, None, False, marks=pytest.mark.slow),
+    (True, True, True, True),
+    (True, True, False, False),
+]
+
+
+def _hsa_authorization(
+    hsa_params_factory,
+    user,
+    data_source,
+    organization=None,
+    resource=None,
+    has_organization_rights=None,
+):
+    """Returns a signed HSA Authorization header value for the given params"""
+    hsa_params = {
+        "user": user,
+        "data_source": data_source,
+        "organization": organization,
+        "resource": resource,
+    }
+    if has_organization_rights is not None:
+        hsa_params["has_organization_rights"] = has_organization_rights
+    params = hsa_params_factory(**hsa_params)
+    return "haukisigned " + urllib.parse.urlencode(params)
+
+
+@pytest.fixture
+def second_parent(resource_organization, resource_factory):
+    return resource_factory(
+        name="Second parent resource", organization=resource_organization
+    )
 
 
 #
@@ -21,9 +91,7 @@ def test_get_public_resource_anonymous(resource, api_client):
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
 
 @pytest.mark.django_db
@@ -36,9 +104,7 @@ def test_get_non_public_resource_anonymous(resource, api_client):
         content_type="application/json",
     )
 
-    assert response.status_code == 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 404)
 
 
 @pytest.mark.django_db
@@ -55,60 +121,48 @@ def test_get_child_of_non_public_resource_anonymous(
         content_type="application/json",
     )
 
-    assert response.status_code == 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 404)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize("resource__is_public", [False])
-def test_get_non_public_resource_authenticated_no_org(resource, user, api_client):
-    api_client.force_authenticate(user=user)
-
+def test_get_non_public_resource_authenticated_no_org(
+    resource, authenticated_api_client
+):
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
-    response = api_client.get(
+    response = authenticated_api_client.get(
         url,
         content_type="application/json",
     )
 
-    assert response.status_code == 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 404)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize("resource__is_public", [False])
 def test_get_non_public_resource_authenticated_has_org(
-    organization_factory, data_source, resource, user, api_client
+    resource_organization,
+    resource,
+    user,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-    resource.organization = organization
-    resource.save()
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
-    response = api_client.get(
+    response = authenticated_api_client.get(
         url,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize("resource__is_public", [False])
 def test_get_non_public_resource_authenticated_parent_org(
-    organization_factory, data_source, resource, user, api_client
+    organization_factory, data_source, resource, user, authenticated_api_client
 ):
     organization1 = organization_factory(
         origin_id=12345,
@@ -125,26 +179,23 @@ def test_get_non_public_resource_authenticated_parent_org(
     organization1.regular_users.add(user)
     organization2.parent = organization1
     organization2.save()
-    api_client.force_authenticate(user=user)
     resource.organization = organization2
-    resource.save()
+    resource.save(update_fields=["organization"])
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
-    response = api_client.get(
+    response = authenticated_api_client.get(
         url,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize("resource__is_public", [False])
 def test_get_non_public_resource_authenticated_different_org(
-    organization_factory, data_source, resource, user, api_client
+    organization_factory, data_source, resource, user, authenticated_api_client
 ):
     organization1 = organization_factory(
         origin_id=12345,
@@ -159,92 +210,90 @@ def test_get_non_public_resource_authenticated_different_org(
     )
 
     organization1.regular_users.add(user)
-    api_client.force_authenticate(user=user)
     resource.organization = organization2
-    resource.save()
+    resource.save(update_fields=["organization"])
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
-    response = api_client.get(
-        url,
-        content_type="application/json",
-    )
-
-    assert response.status_code == 404, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_resource_anonymous(api_client):
-    url = reverse("resource-list")
-
-    data = {"name": "Test name"}
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_resource_authenticated_no_org(user, api_client):
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
-
-    data = {"name": "Test name"}
-
-    response = api_client.post(
+    response = authenticated_api_client.get(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
         content_type="application/json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 404)
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_has_org(
-    organization_factory, data_source, user, api_client
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org", 400),
+        ("has_org", 201),
+        ("parent_org", 201),
+        ("different_org", 403),
+    ],
+)
+def test_create_resource_permissions(
+    organization_factory,
+    data_source,
+    user,
+    api_client,
+    scenario,
+    expected_status_code,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    if scenario != "anonymous":
+        api_client.force_authenticate(user=user)
 
-    url = reverse("resource-list")
+    data = {"name": "Test name"}
 
-    data = {
-        "name": "Test name",
-        "organization": organization.id,
-    }
+    if scenario in ["has_org", "parent_org", "different_org"]:
+        organization = organization_factory(
+            origin_id=12345,
+            data_source=data_source,
+            name="Test organization",
+        )
+        organization.regular_users.add(user)
+        data["organization"] = organization.id
+
+    if scenario in ["parent_org", "different_org"]:
+        # The user is only a member of the first organization
+        other_organization = organization_factory(
+            origin_id=23456,
+            data_source=data_source,
+            name="Test organization",
+            parent=organization if scenario == "parent_org" else None,
+        )
+        data["organization"] = other_organization.id
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_non_editable_data_source(
-    organization_factory, data_source, user, user_origin_factory, api_client
+@pytest.mark.parametrize(
+    "origin_data_source, expected_status_code",
+    [
+        ("editable", 201),
+        ("non_editable", 400),
+        ("wrong", 400),
+        ("unknown", 400),
+    ],
+)
+def test_create_resource_authenticated_origin_data_source(
+    organization_factory,
+    data_source,
+    data_source_factory,
+    user,
+    user_origin_factory,
+    authenticated_api_client,
+    origin_data_source,
+    expected_status_code,
 ):
     user_origin_factory(data_source=data_source, user=user)
     organization = organization_factory(
@@ -254,51 +303,17 @@ def test_create_resource_authenticated_non_editable_data_source(
     )
 
     organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
-
-    data_source.user_editable_resources = False
-    data_source.save()
-    data = {
-        "name": "Test name",
-        "organization": organization.id,
-        "origins": [
-            {
-                "data_source": {
-                    "id": data_source.id,
-                },
-                "origin_id": "1",
-            }
-        ],
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_resource_authenticated_editable_data_source(
-    organization_factory, data_source, user, user_origin_factory, api_client
-):
-    user_origin_factory(data_source=data_source, user=user)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
 
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    if origin_data_source == "non_editable":
+        data_source.user_editable_resources = False
+        data_source.save()
 
-    url = reverse("resource-list")
+    if origin_data_source == "wrong":
+        origin_data_source_id = data_source_factory().id
+    elif origin_data_source == "unknown":
+        origin_data_source_id = "unknown_id"
+    else:
+        origin_data_source_id = data_source.id
 
     data = {
         "name": "Test name",
@@ -306,22 +321,20 @@ def test_create_resource_authenticated_editable_data_source(
         "origins": [
             {
                 "data_source": {
-                    "id": data_source.id,
+                    "id": origin_data_source_id,
                 },
                 "origin_id": "1",
             }
         ],
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
 
 @pytest.mark.django_db
@@ -332,7 +345,7 @@ def test_create_resource_authenticated_previously_used_id(
     data_source,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     resource_origin_factory(resource=resource, data_source=data_source, origin_id="1")
 
@@ -344,9 +357,6 @@ def test_create_resource_authenticated_previously_used_id(
     )
 
     organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
 
     data = {
         "name": "Test name",
@@ -361,15 +371,13 @@ def test_create_resource_authenticated_previously_used_id(
         ],
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 201)
 
     new_resource = Resource.objects.get(pk=response.data["id"])
 
@@ -377,333 +385,131 @@ def test_create_resource_authenticated_previously_used_id(
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_wrong_data_source(
-    organization_factory,
-    data_source,
-    data_source_factory,
-    user,
-    user_origin_factory,
-    api_client,
+def test_create_child_resource_authenticated(
+    resource, resource_organization, user, authenticated_api_client
 ):
-    user_origin_factory(data_source=data_source, user=user)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    another_data_source = data_source_factory()
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
+    resource_organization.regular_users.add(user)
 
     data = {
         "name": "Test name",
-        "organization": organization.id,
-        "origins": [
-            {
-                "data_source": {
-                    "id": another_data_source.id,
-                },
-                "origin_id": "1",
-            }
-        ],
+        "organization": resource_organization.id,
+        "parents": [resource.id],
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 201)
+
+    new_resource = Resource.objects.get(pk=response.data["id"])
+
+    assert new_resource.parents.count() == 1
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_unknown_data_source(
-    organization_factory, data_source, user, user_origin_factory, api_client
+def test_create_child_resource_authenticated_parent_has_different_org(
+    resource,
+    resource_organization,
+    resource_factory,
+    organization_factory,
+    data_source,
+    user,
+    authenticated_api_client,
 ):
-    user_origin_factory(data_source=data_source, user=user)
-    organization = organization_factory(
-        origin_id=12345,
+    organization2 = organization_factory(
+        origin_id=23456,
         data_source=data_source,
-        name="Test organization",
+        name="Test organization 2",
     )
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
+    resource2 = resource_factory(name="Test resource", organization=organization2)
+    organization2.regular_users.add(user)
 
     data = {
         "name": "Test name",
-        "organization": organization.id,
-        "origins": [
-            {
-                "data_source": {
-                    "id": "unknown_id",
-                },
-                "origin_id": "1",
-            }
-        ],
+        "organization": organization2.id,
+        "parents": [resource.id, resource2.id],
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 400)
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_parent_org(
-    organization_factory, data_source, user, api_client
-):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    organization2 = organization_factory(
-        origin_id=23456,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    organization2.parent = organization1
-    organization2.save()
-    organization1.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+def test_update_resource_anonymous(resource, api_client):
+    original_name = resource.name
 
-    url = reverse("resource-list")
+    url = reverse("resource-detail", kwargs={"pk": resource.id})
 
-    data = {
-        "name": "Test name",
-        "organization": organization2.id,
-    }
+    data = {"name": "New name"}
 
-    response = api_client.post(
+    response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    resource = Resource.objects.get(id=resource.id)
+
+    assert resource.name == original_name
+
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
-def test_create_resource_authenticated_different_org(
-    organization_factory, data_source, user, api_client
+def test_update_resource_authenticated_no_org_permission(
+    resource,
+    resource_organization,
+    authenticated_api_client,
 ):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    organization2 = organization_factory(
-        origin_id=23456,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    organization1.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
-
-    data = {
-        "name": "Test name",
-        "organization": organization2.id,
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_child_resource_authenticated(
-    resource, organization_factory, data_source, user, api_client
-):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization1
-    resource.save()
-
-    organization1.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
-
-    data = {
-        "name": "Test name",
-        "organization": organization1.id,
-        "parents": [resource.id],
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
-
-    new_resource = Resource.objects.get(pk=response.data["id"])
-
-    assert new_resource.parents.count() == 1
-
-
-@pytest.mark.django_db
-def test_create_child_resource_authenticated_parent_has_different_org(
-    resource, resource_factory, organization_factory, data_source, user, api_client
-):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization1
-    resource.save()
-
-    organization2 = organization_factory(
-        origin_id=23456,
-        data_source=data_source,
-        name="Test organization 2",
-    )
-    resource2 = resource_factory(name="Test resource", organization=organization2)
-    organization2.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("resource-list")
-
-    data = {
-        "name": "Test name",
-        "organization": organization2.id,
-        "parents": [resource.id, resource2.id],
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_resource_anonymous(resource, api_client):
-    original_name = resource.name
-
-    url = reverse("resource-detail", kwargs={"pk": resource.id})
-
-    data = {"name": "New name"}
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    resource = Resource.objects.get(id=resource.id)
-
-    assert resource.name == original_name
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_resource_authenticated_no_org_permission(
-    resource, data_source, organization_factory, user, api_client
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
     original_name = resource.name
 
-    api_client.force_authenticate(user=user)
-
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
     resource = Resource.objects.get(id=resource.id)
 
     assert resource.name == original_name
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 def test_update_resource_authenticated_has_org_permission(
-    resource, data_source, organization_factory, user, api_client
+    resource,
+    resource_organization,
+    user,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
-
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
     resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert resource.name == "New name"
 
@@ -713,24 +519,15 @@ def test_update_resource_authenticated_non_editable_data_source(
     resource,
     data_source,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -739,15 +536,13 @@ def test_update_resource_authenticated_non_editable_data_source(
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
@@ -756,24 +551,15 @@ def test_update_resource_data_source_authenticated_non_editable_data_source(
     data_source,
     data_source_factory,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -792,15 +578,13 @@ def test_update_resource_data_source_authenticated_non_editable_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
@@ -808,39 +592,28 @@ def test_update_resource_authenticated_editable_data_source(
     resource,
     data_source,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
 
-    organization.regular_users.add(user)
-
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
     resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
     assert resource.name == "New name"
 
 
@@ -849,24 +622,15 @@ def test_update_resource_with_data_source_authenticated_editable_data_source(
     resource,
     data_source,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource, origin_id="1")
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -881,16 +645,13 @@ def test_update_resource_with_data_source_authenticated_editable_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
-    resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
     assert resource.origins.all()[0].origin_id == "1"
 
 
@@ -899,24 +660,15 @@ def test_update_resource_data_source_authenticated_editable_data_source(
     resource,
     data_source,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource, origin_id="1")
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -931,18 +683,16 @@ def test_update_resource_data_source_authenticated_editable_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
-    resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
-    assert resource.origins.count() == 1
-    assert resource.origins.all()[0].origin_id == "2"
+    assert_response_status_code(response, 200)
+    origins = list(resource.origins.all())
+    assert len(origins) == 1
+    assert origins[0].origin_id == "2"
 
 
 @pytest.mark.django_db
@@ -951,24 +701,15 @@ def test_update_resource_change_data_source_authenticated_editable_data_source(
     data_source,
     data_source_factory,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -985,19 +726,17 @@ def test_update_resource_change_data_source_authenticated_editable_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
-    resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
-    assert resource.origins.count() == 1
-    assert resource.origins.all()[0].data_source.id == another_data_source.id
-    assert resource.origins.all()[0].origin_id == "2"
+    assert_response_status_code(response, 200)
+    origins = list(resource.origins.all())
+    assert len(origins) == 1
+    assert origins[0].data_source_id == another_data_source.id
+    assert origins[0].origin_id == "2"
 
 
 @pytest.mark.django_db
@@ -1006,24 +745,15 @@ def test_update_resource_add_data_source_authenticated_editable_data_source(
     data_source,
     data_source_factory,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource, origin_id="1")
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -1046,16 +776,13 @@ def test_update_resource_add_data_source_authenticated_editable_data_source(
         ]
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
-    resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
     assert resource.origins.count() == 2
 
 
@@ -1065,25 +792,15 @@ def test_update_resource_authenticated_wrong_data_source(
     data_source,
     data_source_factory,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
 
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -1099,15 +816,13 @@ def test_update_resource_authenticated_wrong_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 400)
 
 
 @pytest.mark.django_db
@@ -1115,25 +830,15 @@ def test_update_resource_authenticated_unknown_data_source(
     resource,
     data_source,
     resource_origin_factory,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
-    api_client,
+    authenticated_api_client,
 ):
     user_origin_factory(data_source=data_source, user=user)
     resource_origin_factory(data_source=data_source, resource=resource)
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
 
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
-
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -1148,74 +853,64 @@ def test_update_resource_authenticated_unknown_data_source(
         ],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 400)
 
 
 @pytest.mark.django_db
 def test_update_resource_authenticated_has_parent_org_permission(
-    resource, data_source, organization_factory, user, api_client
+    resource,
+    data_source,
+    organization_factory,
+    resource_organization,
+    user,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
     organization2 = organization_factory(
         origin_id=23456,
         data_source=data_source,
         name="Test organization",
     )
-    organization.parent = organization2
-    organization.save()
+    resource_organization.parent = organization2
+    resource_organization.save()
     organization2.regular_users.add(user)
-    api_client.force_authenticate(user=user)
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
     resource = Resource.objects.get(id=resource.id)
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert resource.name == "New name"
 
 
 @pytest.mark.django_db
 def test_update_child_resource_authenticated(
-    resource, resource_factory, organization_factory, data_source, user, api_client
+    resource,
+    resource_factory,
+    resource_organization,
+    user,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
+    sub_resource = resource_factory(
+        name="Test resource", organization=resource_organization
     )
-    resource.organization = organization
-    resource.save()
-    sub_resource = resource_factory(name="Test resource", organization=organization)
     sub_resource.parents.add(resource)
 
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("resource-detail", kwargs={"pk": sub_resource.id})
 
@@ -1223,33 +918,27 @@ def test_update_child_resource_authenticated(
         "parents": [],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
+        data=data,
+        format="json",
     )
 
-    sub_resource = Resource.objects.get(pk=sub_resource.id)
+    assert_response_status_code(response, 200)
 
     assert sub_resource.parents.count() == 0
 
 
 @pytest.mark.django_db
 def test_update_child_resource_authenticated_parent_has_different_org(
-    resource, resource_factory, organization_factory, data_source, user, api_client
+    resource,
+    resource_organization,
+    resource_factory,
+    organization_factory,
+    data_source,
+    user,
+    authenticated_api_client,
 ):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization1
-    resource.save()
-
     organization2 = organization_factory(
         origin_id=23456,
         data_source=data_source,
@@ -1261,7 +950,6 @@ def test_update_child_resource_authenticated_parent_has_different_org(
     sub_resource.parents.add(resource2)
 
     organization2.regular_users.add(user)
-    api_client.force_authenticate(user=user)
 
     url = reverse("resource-detail", kwargs={"pk": sub_resource.id})
 
@@ -1269,40 +957,26 @@ def test_update_child_resource_authenticated_parent_has_different_org(
         "parents": [],
     }
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
+@pytest.mark.parametrize("resource__is_public", [False])
 def test_get_non_public_resource_hsa_authenticated(
     resource,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1312,29 +986,18 @@ def test_get_non_public_resource_hsa_authenticated(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.is_public = False
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
+    if set_hsa_resource:
+        resource_origin_factory(resource=resource, data_source=data_source)
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -1344,35 +1007,21 @@ def test_get_non_public_resource_hsa_authenticated(
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    assert response.status_code == 200 if should_succeed else 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200 if should_succeed else 404)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
+@pytest.mark.parametrize("resource__is_public", [False])
 def test_get_child_of_non_public_resource_hsa_authenticated(
     resource,
     resource_origin_factory,
     resource_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1382,32 +1031,21 @@ def test_get_child_of_non_public_resource_hsa_authenticated(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.is_public = False
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
+    if set_hsa_resource:
+        resource_origin_factory(resource=resource, data_source=data_source)
 
     child_resource = resource_factory(name="Child resource")
     child_resource.parents.add(resource)
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     url = reverse("resource-detail", kwargs={"pk": child_resource.id})
 
@@ -1417,34 +1055,19 @@ def test_get_child_of_non_public_resource_hsa_authenticated(
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    assert response.status_code == 200 if should_succeed else 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200 if should_succeed else 404)
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
 def test_create_resource_hsa_authenticated_child_resource_permissions(
     resource,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1454,77 +1077,48 @@ def test_create_resource_hsa_authenticated_child_resource_permissions(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
-
-    user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
     if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+        resource_origin_factory(resource=resource, data_source=data_source)
 
-    url = reverse("resource-list")
+    user_origin_factory(user=user, data_source=data_source)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     data = {"name": "New name", "parents": [resource.id]}
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
         HTTP_AUTHORIZATION=authz_string,
     )
 
     if should_succeed:
-        assert response.status_code == 201, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 201)
         child_resource = resource.children.all()[0]
         assert child_resource.name == "New name"
     else:
-        assert response.status_code == 400, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 400)
         assert not resource.children.all()
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, False),
-        (False, True, True, False),
-        (False, True, False, False),
-        (True, True, None, False),
-        (True, True, True, True),
-        (True, True, False, False),
-    ],
+    HSA_ORGANIZATION_RIGHTS_ONLY_CASES,
 )
 def test_create_resource_hsa_authenticated_child_resource_with_different_parents(
     resource,
-    resource_factory,
+    second_parent,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1534,80 +1128,47 @@ def test_create_resource_hsa_authenticated_child_resource_with_different_parents
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
-    second_parent = resource_factory(name="Second parent resource")
-    second_parent.organization = organization
-    second_parent.save()
-    resource_origin_factory(resource=second_parent, data_source=data_source)
-
-    user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
     if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+        resource_origin_factory(resource=resource, data_source=data_source)
 
-    url = reverse("resource-list")
+    user_origin_factory(user=user, data_source=data_source)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     data = {"name": "New name", "parents": [resource.id, second_parent.id]}
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        RESOURCE_LIST_URL,
+        data=data,
+        format="json",
         HTTP_AUTHORIZATION=authz_string,
     )
 
     if should_succeed:
-        assert response.status_code == 201, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 201)
         child_resource = resource.children.all()[0]
         assert child_resource.name == "New name"
     else:
-        assert response.status_code == 400, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 400)
         assert not resource.children.all()
 
 
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
 def test_update_resource_hsa_authenticated_resource_permissions(
     resource,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1617,29 +1178,19 @@ def test_update_resource_hsa_authenticated_resource_permissions(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
+    if set_hsa_resource:
+        resource_origin_factory(resource=resource, data_source=data_source)
     existing_name = resource.name
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     url = reverse("resource-detail", kwargs={"pk": resource.id})
 
@@ -1647,23 +1198,19 @@ def test_update_resource_hsa_authenticated_resource_permissions(
 
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    resource = Resource.objects.get(id=resource.id)
+    resource.refresh_from_db(fields=["name"])
 
     if should_succeed:
-        assert response.status_code == 200, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 200)
 
         assert resource.name == "New name"
     else:
-        assert response.status_code == 403, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 403)
 
         assert resource.name == existing_name
 
@@ -1671,27 +1218,14 @@ def test_update_resource_hsa_authenticated_resource_permissions(
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
 def test_update_resource_hsa_authenticated_child_resource_permissions(
     resource,
     resource_factory,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
@@ -1701,32 +1235,22 @@ def test_update_resource_hsa_authenticated_child_resource_permissions(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
+    if set_hsa_resource:
+        resource_origin_factory(resource=resource, data_source=data_source)
 
     child_resource = resource_factory(name="Child resource")
     child_resource.parents.add(resource)
     existing_name = child_resource.name
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     url = reverse("resource-detail", kwargs={"pk": child_resource.id})
 
@@ -1734,402 +1258,243 @@ def test_update_resource_hsa_authenticated_child_resource_permissions(
 
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    child_resource = Resource.objects.get(id=child_resource.id)
+    child_resource.refresh_from_db(fields=["name"])
 
     if should_succeed:
-        assert response.status_code == 200, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 200)
 
         assert child_resource.name == "New child resource name"
     else:
-        assert response.status_code == 403, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 403)
 
         assert child_resource.name == existing_name
 
 
+# In each of these operations the signed resource alone doesn't give permission
+# to the target, either because the target has (or would get) another parent
+# or because the target is not related to the signed resource at all. The
+# target's parents and the new parents in the payload are given as fixture
+# names. Without new parents the operation renames the target.
 @pytest.mark.django_db
 @pytest.mark.parametrize(
-    "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
+    "target_parents, target_in_organization, new_parents, "
+    "signed_resource_failure_status_code",
     [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, False),
-        (False, True, True, False),
-        (False, True, False, False),
-        (True, True, None, False),
-        (True, True, True, True),
-        (True, True, False, False),
+        pytest.param(
+            ["resource", "second_parent"],
+            False,
+            None,
+            403,
+            id="rename_child_with_different_parents",
+        ),
+        # Signed resource users get a validation error for the parent they
+        # are not allowed to add
+        pytest.param(
+            ["resource"],
+            False,
+            ["resource", "second_parent"],
+            400,
+            id="add_another_parent_to_child",
+        ),
+        pytest.param(
+            [],
+            True,
+            None,
+            403,
+            id="rename_same_org_other_resource",
+        ),
     ],
 )
-def test_update_resource_hsa_authenticated_child_resource_with_different_parents(  # noqa
+@pytest.mark.parametrize(
+    "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
+    HSA_ORGANIZATION_RIGHTS_ONLY_CASES,
+)
+def test_update_resource_hsa_authenticated_without_resource_rights(
+    request,
     resource,
     resource_factory,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     api_client,
     hsa_params_factory,
+    target_parents,
+    target_in_organization,
+    new_parents,
+    signed_resource_failure_status_code,
     set_hsa_organization,
     set_hsa_resource,
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
     resource_origin_factory(resource=resource, data_source=data_source)
-    second_parent = resource_factory(name="Second parent resource")
-    second_parent.organization = organization
-    second_parent.save()
-    resource_origin_factory(resource=second_parent, data_source=data_source)
 
-    child_resource = resource_factory(name="Child resource")
-    child_resource.parents.add(resource)
-    child_resource.parents.add(second_parent)
-    existing_name = child_resource.name
+    target = resource_factory(
+        name="Target resource",
+        organization=resource_organization if target_in_organization else None,
+    )
+    target.parents.add(*(request.getfixturevalue(name) for name in target_parents))
+
+    if new_parents is None:
+        data = {"name": "New name"}
+    else:
+        data = {"parents": [request.getfixturevalue(name).id for name in new_parents]}
+
+    existing_name = target.name
+    existing_parent_ids = set(target.parents.values_list("id", flat=True))
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
 
-    url = reverse("resource-detail", kwargs={"pk": child_resource.id})
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=resource if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
-    data = {"name": "New child resource name"}
+    url = reverse("resource-detail", kwargs={"pk": target.id})
 
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    child_resource = Resource.objects.get(id=child_resource.id)
+    target.refresh_from_db(fields=["name"])
+    parent_ids = set(target.parents.values_list("id", flat=True))
 
     if should_succeed:
-        assert response.status_code == 200, "{} {}".format(
-            response.status_code, response.data
-        )
+        assert_response_status_code(response, 200)
 
-        assert child_resource.name == "New child resource name"
+        assert target.name == data.get("name", existing_name)
+        assert parent_ids == set(data.get("parents", existing_parent_ids))
     else:
-        assert response.status_code == 403, "{} {}".format(
-            response.status_code, response.data
+        assert_response_status_code(
+            response,
+            signed_resource_failure_status_code if set_hsa_resource else 403,
         )
 
-        assert child_resource.name == existing_name
+        assert target.name == existing_name
+        assert parent_ids == existing_parent_ids
 
 
 @pytest.mark.django_db
-@pytest.mark.parametrize(
-    "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, False),
-        (False, True, True, False),
-        (False, True, False, False),
-        (True, True, None, False),
-        (True, True, True, True),
-        (True, True, False, False),
-    ],
-)
-def test_update_resource_hsa_authenticated_add_another_parent_to_child(
-    resource,
-    resource_factory,
-    resource_origin_factory,
-    data_source,
-    organization_factory,
-    user,
-    user_origin_factory,
-    api_client,
-    hsa_params_factory,
-    set_hsa_organization,
-    set_hsa_resource,
-    has_organization_rights,
-    should_succeed,
+def test_filter_queryset_by_read_permission(
+    data_source, organization_factory, user, django_assert_num_queries
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
-    second_parent = resource_factory(name="Second parent resource")
-    second_parent.organization = organization
-    second_parent.save()
-    resource_origin_factory(resource=second_parent, data_source=data_source)
+    #         resource A
+    #         org 1
+    #         public
+    #             |
+    #      +------+------+
+    #      |             |
+    # resource B     resource C
+    # org 2          org 3
+    # public         non-public
+    #      |             |
+    #      +------+------+
+    #             |
+    #         resource D
+    #         org 4
+    #         non-public
 
-    child_resource = resource_factory(name="Child resource")
-    child_resource.parents.add(resource)
-
-    user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
-
-    url = reverse("resource-detail", kwargs={"pk": child_resource.id})
-
-    data = {"parents": [resource.id, second_parent.id]}
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-        HTTP_AUTHORIZATION=authz_string,
-    )
-
-    child_resource = Resource.objects.get(id=child_resource.id)
-
-    if should_succeed:
-        assert response.status_code == 200, "{} {}".format(
-            response.status_code, response.data
-        )
-
-        assert set(child_resource.parents.all()) == {resource, second_parent}
-    elif set_hsa_resource:
-        assert response.status_code == 400, "{} {}".format(
-            response.status_code, response.data
-        )
-
-        assert set(child_resource.parents.all()) == {resource}
-    else:
-        assert response.status_code == 403, "{} {}".format(
-            response.status_code, response.data
-        )
-
-        assert set(child_resource.parents.all()) == {resource}
-
-
-@pytest.mark.django_db
-@pytest.mark.parametrize(
-    "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, False),
-        (False, True, True, False),
-        (False, True, False, False),
-        (True, True, None, False),
-        (True, True, True, True),
-        (True, True, False, False),
-    ],
-)
-def test_update_resource_hsa_authenticated_same_org_other_resource_permissions(
-    resource,
-    resource_factory,
-    resource_origin_factory,
-    data_source,
-    organization_factory,
-    user,
-    user_origin_factory,
-    api_client,
-    hsa_params_factory,
-    set_hsa_organization,
-    set_hsa_resource,
-    has_organization_rights,
-    should_succeed,
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-    resource_origin_factory(resource=resource, data_source=data_source)
-
-    other_resource = resource_factory(name="Other resource", organization=organization)
-    existing_name = other_resource.name
-    resource_origin_factory(resource=other_resource, data_source=data_source)
-
-    user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = resource
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
-
-    url = reverse("resource-detail", kwargs={"pk": other_resource.id})
-
-    data = {"name": "New other resource name"}
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-        HTTP_AUTHORIZATION=authz_string,
-    )
-
-    other_resource = Resource.objects.get(id=other_resource.id)
-
-    if should_succeed:
-        assert response.status_code == 200, "{} {}".format(
-            response.status_code, response.data
-        )
-
-        assert other_resource.name == "New other resource name"
-    else:
-        assert response.status_code == 403, "{} {}".format(
-            response.status_code, response.data
-        )
-
-        assert other_resource.name == existing_name
-
-
-@pytest.mark.django_db
-def test_filter_queryset_by_read_permission(
-    resource_factory, data_source, organization_factory, user
-):
-    #         resource A
-    #         org 1
-    #         public
-    #             |
-    #      +------+------+
-    #      |             |
-    # resource B     resource C
-    # org 2          org 3
-    # public         non-public
-    #      |             |
-    #      +------+------+
-    #             |
-    #         resource D
-    #         org 4
-    #         non-public
-
-    org1 = organization_factory(
-        origin_id=1,
-        data_source=data_source,
-        name="Org 1",
-    )
-    org2 = organization_factory(
-        origin_id=2,
-        data_source=data_source,
-        name="Org 2",
-    )
-    org3 = organization_factory(
-        origin_id=3,
-        data_source=data_source,
-        name="Org 3",
+    org1, org2, org3, org4 = [
+        organization_factory(origin_id=i, data_source=data_source, name=f"Org {i}")
+        for i in range(1, 5)
+    ]
+
+    resource_a, resource_b, resource_c, resource_d = Resource.objects.bulk_create(
+        [
+            Resource(name="Resource A", organization=org1, is_public=True),
+            Resource(name="Resource B", organization=org2, is_public=True),
+            Resource(name="Resource C", organization=org3, is_public=False),
+            Resource(name="Resource D", organization=org4, is_public=False),
+        ]
     )
-    org4 = organization_factory(
-        origin_id=4,
-        data_source=data_source,
-        name="Org 4",
+    resource_parents = Resource.parents.through
+    resource_parents.objects.bulk_create(
+        [
+            resource_parents(from_resource=resource_a, to_resource=resource_b),
+            resource_parents(from_resource=resource_a, to_resource=resource_c),
+            resource_parents(from_resource=resource_b, to_resource=resource_d),
+            resource_parents(from_resource=resource_c, to_resource=resource_d),
+        ]
     )
-
-    resource_a = resource_factory(name="Resource A", organization=org1)
-    resource_b = resource_factory(name="Resource B", organization=org2)
-    resource_b.parents.add(resource_a)
-    resource_c = resource_factory(name="Resource C", organization=org3, is_public=False)
-    resource_c.parents.add(resource_a)
-    resource_d = resource_factory(name="Resource D", organization=org4, is_public=False)
-    resource_d.parents.add(resource_b)
-    resource_d.parents.add(resource_c)
+    # bulk_create doesn't send m2m_changed, so update the ancestry fields here.
+    # This also updates the ancestry of resource D.
+    resource_b.update_ancestry()
+    resource_c.update_ancestry()
 
     queryset = Resource.objects.all()
 
+    # The permission filter is a single query on top of the queries in
+    # User.get_all_organizations(): two for a user without organizations and
+    # five for a user with one organization membership. The number of queries
+    # must not depend on the number of resources.
+
     # non-organization user only sees public resources
-    filtered = filter_queryset_by_permission(user, queryset)
+    with django_assert_num_queries(3):
+        filtered = list(filter_queryset_by_permission(user, queryset))
     assert len(filtered) == 2
-    assert set(filtered) == {
-        resource_a,
-        resource_b,
+    assert {resource.id for resource in filtered} == {
+        resource_a.id,
+        resource_b.id,
     }
 
     # org4 user doesn't see org4 resource_d, because he doesn't belong
     # to parent org3 or org2
     org4.regular_users.add(user)
-    filtered = filter_queryset_by_permission(user, queryset)
+    with django_assert_num_queries(6):
+        filtered = list(filter_queryset_by_permission(user, queryset))
     assert len(filtered) == 2
-    assert set(filtered) == {
-        resource_a,
-        resource_b,
+    assert {resource.id for resource in filtered} == {
+        resource_a.id,
+        resource_b.id,
     }
     org4.regular_users.remove(user)
 
     # org4 resource_d is visible if user belongs to org2 or org3
     org3.regular_users.add(user)
-    filtered = filter_queryset_by_permission(user, queryset)
+    with django_assert_num_queries(6):
+        filtered = list(filter_queryset_by_permission(user, queryset))
     assert len(filtered) == 3
-    assert set(filtered) == {
-        resource_a,
-        resource_b,
-        resource_d,
+    assert {resource.id for resource in filtered} == {
+        resource_a.id,
+        resource_b.id,
+        resource_d.id,
     }
     org3.regular_users.remove(user)
     org2.regular_users.add(user)
-    filtered = filter_queryset_by_permission(user, queryset)
+    with django_assert_num_queries(6):
+        filtered = list(filter_queryset_by_permission(user, queryset))
     assert len(filtered) == 3
-    assert set(filtered) == {
-        resource_a,
-        resource_b,
-        resource_d,
+    assert {resource.id for resource in filtered} == {
+        resource_a.id,
+        resource_b.id,
+        resource_d.id,
     }
     org2.regular_users.remove(user)
 
     # all resources are only visible if user belongs to org1
     org1.regular_users.add(user)
-    filtered = filter_queryset_by_permission(user, queryset)
+    with django_assert_num_queries(6):
+        filtered = list(filter_queryset_by_permission(user, queryset))
     assert len(filtered) == 4
-    assert set(filtered) == {
-        resource_a,
-        resource_b,
-        resource_c,
-        resource_d,
+    assert {resource.id for resource in filtered} == {
+        resource_a.id,
+        resource_b.id,
+        resource_c.id,
+        resource_d.id,
     }
 
 
@@ -2138,12 +1503,11 @@ def test_filter_queryset_by_read_permission(
 #
 @pytest.mark.django_db
 def test_list_date_periods_public(
-    api_client,
+    authenticated_api_client,
     organization_factory,
     data_source,
     resource_factory,
     date_period_factory,
-    user,
 ):
     organization = organization_factory(
         origin_id=12345,
@@ -2161,17 +1525,13 @@ def test_list_date_periods_public(
     resource2 = resource_factory(organization=organization2)
     date_period2 = date_period_factory(resource=resource2)
 
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
-    response = api_client.get(
-        url, content_type="application/json", data={"start_date_gte": "1970-01-01"}
+    response = authenticated_api_client.get(
+        DATE_PERIOD_LIST_URL,
+        content_type="application/json",
+        data={"start_date_gte": "1970-01-01"},
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert len(response.data) == 2
 
@@ -2200,31 +1560,24 @@ def test_list_date_periods_one_non_public_unauthenticated(
     resource2 = resource_factory(organization=organization2)
     date_period2 = date_period_factory(resource=resource2)
 
-    url = reverse("date_period-list")
-
     response = api_client.get(
-        url, content_type="application/json", data={"start_date_gte": "1970-01-01"}
-    )
-
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
+        DATE_PERIOD_LIST_URL,
+        content_type="application/json",
+        data={"start_date_gte": "1970-01-01"},
     )
 
-    assert len(response.data) == 1
-
-    date_period_ids = {i["id"] for i in response.data}
+    assert_response_status_code(response, 200)
 
-    assert date_period_ids == {date_period2.id}
+    assert [i["id"] for i in response.data] == [date_period2.id]
 
 
 @pytest.mark.django_db
 def test_list_date_periods_one_non_public_authenticated_user_not_in_org(
-    api_client,
+    authenticated_api_client,
     organization_factory,
     data_source,
     resource_factory,
     date_period_factory,
-    user,
 ):
     organization = organization_factory(
         origin_id=12345,
@@ -2242,28 +1595,20 @@ def test_list_date_periods_one_non_public_authenticated_user_not_in_org(
     resource2 = resource_factory(organization=organization2)
     date_period2 = date_period_factory(resource=resource2)
 
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
-    response = api_client.get(
-        url, content_type="application/json", data={"start_date_gte": "1970-01-01"}
-    )
-
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
+    response = authenticated_api_client.get(
+        DATE_PERIOD_LIST_URL,
+        content_type="application/json",
+        data={"start_date_gte": "1970-01-01"},
     )
 
-    assert len(response.data) == 1
-
-    date_period_ids = {i["id"] for i in response.data}
+    assert_response_status_code(response, 200)
 
-    assert date_period_ids == {date_period2.id}
+    assert [i["id"] for i in response.data] == [date_period2.id]
 
 
 @pytest.mark.django_db
 def test_list_date_periods_one_non_public_authenticated_user_in_org(
-    api_client,
+    authenticated_api_client,
     organization_factory,
     data_source,
     resource_factory,
@@ -2287,17 +1632,14 @@ def test_list_date_periods_one_non_public_authenticated_user_in_org(
     date_period2 = date_period_factory(resource=resource2)
 
     organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
 
-    url = reverse("date_period-list")
-
-    response = api_client.get(
-        url, content_type="application/json", data={"start_date_gte": "1970-01-01"}
+    response = authenticated_api_client.get(
+        DATE_PERIOD_LIST_URL,
+        content_type="application/json",
+        data={"start_date_gte": "1970-01-01"},
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert len(response.data) == 2
 
@@ -2308,158 +1650,115 @@ def test_list_date_periods_one_non_public_authenticated_user_in_org(
 
 @pytest.mark.django_db
 def test_create_date_period_anonymous(api_client):
-    url = reverse("date_period-list")
-
     data = {"name": "Date period name"}
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 def test_create_date_period_authenticated_no_org_in_resource(
-    api_client, resource, user
+    authenticated_api_client, resource
 ):
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
     data = {
         "name": "Date period name",
         "resource": resource.id,
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 400)
 
 
 @pytest.mark.django_db
 def test_create_date_period_authenticated_no_org_permission(
-    api_client, organization_factory, data_source, resource, user
+    authenticated_api_client,
+    resource_organization,
+    resource,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
     data = {
         "name": "Date period name",
         "resource": resource.id,
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 def test_create_date_period_authenticated_has_org_permission(
-    api_client, organization_factory, data_source, resource, user
+    authenticated_api_client,
+    resource_organization,
+    resource,
+    user,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    organization.regular_users.add(user)
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
+    resource_organization.regular_users.add(user)
 
     data = {
         "name": "Date period name",
         "resource": resource.id,
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 201)
 
 
 @pytest.mark.django_db
 def test_create_date_period_authenticated_has_parent_resource_org_permission(
-    api_client, organization_factory, resource_factory, data_source, resource, user
+    authenticated_api_client,
+    resource_organization,
+    resource_factory,
+    resource,
+    user,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    organization.regular_users.add(user)
+    resource_organization.regular_users.add(user)
 
-    resource.organization = organization
-    resource.save()
     child_resource = resource_factory(name="Test name")
     child_resource.parents.add(resource)
 
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
     data = {
         "name": "Date period name",
         "resource": child_resource.id,
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 201)
 
 
 @pytest.mark.django_db
 def test_create_date_period_authenticated_parent_resource_has_different_org(
-    api_client, organization_factory, resource_factory, data_source, resource, user
+    authenticated_api_client,
+    organization_factory,
+    resource_factory,
+    data_source,
+    resource,
+    resource_organization,
+    user,
 ):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization1
-    resource.save()
     organization2 = organization_factory(
         origin_id=23456,
         data_source=data_source,
@@ -2472,24 +1771,18 @@ def test_create_date_period_authenticated_parent_resource_has_different_org(
     child_resource.parents.add(resource)
     child_resource.parents.add(resource2)
 
-    api_client.force_authenticate(user=user)
-
-    url = reverse("date_period-list")
-
     data = {
         "name": "Date period name",
         "resource": child_resource.id,
     }
 
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+    response = authenticated_api_client.post(
+        DATE_PERIOD_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
@@ -2504,154 +1797,118 @@ def test_update_date_period_anonymous(resource, date_period_factory, api_client)
 
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    date_period = DatePeriod.objects.get(id=date_period.id)
+    date_period.refresh_from_db(fields=["name"])
 
     assert date_period.name == original_name
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 def test_update_date_period_authenticated_no_org_permission(
-    resource, data_source, organization_factory, date_period_factory, user, api_client
+    resource,
+    resource_organization,
+    date_period_factory,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
     date_period = date_period_factory(resource=resource)
 
     original_name = date_period.name
 
-    api_client.force_authenticate(user=user)
-
     url = reverse("date_period-detail", kwargs={"pk": date_period.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    date_period = DatePeriod.objects.get(id=date_period.id)
+    date_period.refresh_from_db(fields=["name"])
 
     assert date_period.name == original_name
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
 
 @pytest.mark.django_db
 def test_update_date_period_authenticated_has_org_permission(
-    resource, data_source, organization_factory, date_period_factory, user, api_client
+    resource,
+    resource_organization,
+    date_period_factory,
+    user,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
     date_period = date_period_factory(resource=resource)
 
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    resource_organization.regular_users.add(user)
 
     url = reverse("date_period-detail", kwargs={"pk": date_period.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    date_period = DatePeriod.objects.get(id=date_period.id)
+    date_period.refresh_from_db(fields=["name"])
 
     assert date_period.name == "New name"
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
 
 @pytest.mark.django_db
 def test_update_date_period_authenticated_has_parent_resource_org_permission(
     resource,
-    data_source,
     resource_factory,
-    organization_factory,
+    resource_organization,
     date_period_factory,
     user,
-    api_client,
+    authenticated_api_client,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    organization.regular_users.add(user)
+    resource_organization.regular_users.add(user)
 
-    resource.organization = organization
-    resource.save()
     child_resource = resource_factory(name="Test name")
     child_resource.parents.add(resource)
 
-    api_client.force_authenticate(user=user)
-
     date_period = date_period_factory(resource=child_resource)
 
     url = reverse("date_period-detail", kwargs={"pk": date_period.id})
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    date_period = DatePeriod.objects.get(id=date_period.id)
+    date_period.refresh_from_db(fields=["name"])
 
     assert date_period.name == "New name"
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
 
 @pytest.mark.django_db
 def test_update_date_period_authenticated_parent_resource_has_different_org(
     resource,
+    resource_organization,
     data_source,
     organization_factory,
     resource_factory,
     date_period_factory,
     user,
-    api_client,
+    authenticated_api_client,
 ):
-    organization1 = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization1
-    resource.save()
     organization2 = organization_factory(
         origin_id=23456,
         data_source=data_source,
@@ -2664,8 +1921,6 @@ def test_update_date_period_authenticated_parent_resource_has_different_org(
     child_resource.parents.add(resource)
     child_resource.parents.add(resource2)
 
-    api_client.force_authenticate(user=user)
-
     date_period = date_period_factory(resource=child_resource)
     original_name = date_period.name
 
@@ -2673,17 +1928,15 @@ def test_update_date_period_authenticated_parent_resource_has_different_org(
 
     data = {"name": "New name"}
 
-    response = api_client.patch(
+    response = authenticated_api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        data=data,
+        format="json",
     )
 
-    date_period = DatePeriod.objects.get(id=date_period.id)
+    date_period.refresh_from_db(fields=["name"])
 
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 403)
 
     assert date_period.name == original_name
 
@@ -2691,26 +1944,14 @@ def test_update_date_period_authenticated_parent_resource_has_different_org(
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "set_hsa_organization,set_hsa_resource,has_organization_rights,should_succeed",
-    [
-        (False, False, None, False),
-        (False, False, True, False),
-        (False, False, False, False),
-        (True, False, None, False),
-        (True, False, True, True),
-        (True, False, False, False),
-        (False, True, None, True),
-        (False, True, True, True),
-        (False, True, False, True),
-        (True, True, None, True),
-        (True, True, True, True),
-        (True, True, False, True),
-    ],
+    HSA_PERMISSION_CASES,
 )
+@pytest.mark.parametrize("resource__is_public", [False])
 def test_get_dateperiod_non_public_resource_hsa_authenticated(
     resource,
     resource_origin_factory,
     data_source,
-    organization_factory,
+    resource_organization,
     user,
     user_origin_factory,
     date_period_factory,
@@ -2721,30 +1962,19 @@ def test_get_dateperiod_non_public_resource_hsa_authenticated(
     has_organization_rights,
     should_succeed,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.is_public = False
-    resource.organization = organization
-    resource.save()
-    origin = resource_origin_factory(resource=resource, data_source=data_source)
+    if set_hsa_resource:
+        origin = resource_origin_factory(resource=resource, data_source=data_source)
     date_period = date_period_factory(resource=resource)
 
     user_origin_factory(user=user, data_source=data_source)
-    hsa_params = {
-        "user": user,
-        "data_source": data_source,
-    }
-    if set_hsa_organization:
-        hsa_params["organization"] = organization
-    if set_hsa_resource:
-        hsa_params["resource"] = data_source.id + ":" + origin.origin_id
-    if has_organization_rights is not None:
-        hsa_params["has_organization_rights"] = has_organization_rights
-    params = hsa_params_factory(**hsa_params)
-    authz_string = "haukisigned " + urllib.parse.urlencode(params)
+    authz_string = _hsa_authorization(
+        hsa_params_factory,
+        user,
+        data_source,
+        organization=resource_organization if set_hsa_organization else None,
+        resource=f"{data_source.id}:{origin.origin_id}" if set_hsa_resource else None,
+        has_organization_rights=has_organization_rights,
+    )
 
     url = reverse("date_period-detail", kwargs={"pk": date_period.id})
 
@@ -2754,9 +1984,7 @@ def test_get_dateperiod_non_public_resource_hsa_authenticated(
         HTTP_AUTHORIZATION=authz_string,
     )
 
-    assert response.status_code == 200 if should_succeed else 404, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200 if should_succeed else 404)
 
 
 @pytest.mark.django_db
@@ -2869,503 +2097,181 @@ def test_filter_dateperiod_queryset_by_read_permission(
 #
 # Rule
 #
-@pytest.mark.django_db
-def test_create_rule_anonymous(api_client):
-    url = reverse("rule-list")
-
-    data = {"name": "Rule name"}
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_rule_authenticated_no_org_in_resource(
-    api_client, resource, date_period_factory, time_span_group_factory, user
-):
+@pytest.fixture
+def resource_time_span_group(resource, date_period_factory, time_span_group_factory):
     date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
+    return time_span_group_factory(period=date_period)
 
-    api_client.force_authenticate(user=user)
 
-    url = reverse("rule-list")
-
-    data = {
-        "name": "Rule name",
-        "group": time_span_group.id,
-        "context": "period",
-        "subject": "week",
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_rule_authenticated_no_org_permission(
-    api_client,
-    organization_factory,
-    data_source,
-    resource,
-    date_period_factory,
-    time_span_group_factory,
-    user,
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
+def _apply_auth_scenario(api_client, user, resource, scenario):
+    """Authenticate the client and grant the user rights per the scenario name"""
+    if scenario == "anonymous":
+        return
 
     api_client.force_authenticate(user=user)
 
-    url = reverse("rule-list")
-
-    data = {
-        "name": "Rule name",
-        "group": time_span_group.id,
-        "context": "period",
-        "subject": "week",
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    if scenario == "has_org":
+        resource.organization.regular_users.add(user)
 
 
 @pytest.mark.django_db
-def test_create_rule_authenticated_has_org_permission(
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org_in_resource", 400),
+        ("no_org", 403),
+        ("has_org", 201),
+    ],
+)
+def test_create_rule_permissions(
+    request,
     api_client,
-    organization_factory,
-    data_source,
-    resource,
-    date_period_factory,
-    time_span_group_factory,
     user,
+    resource,
+    resource_time_span_group,
+    scenario,
+    expected_status_code,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    if scenario != "no_org_in_resource":
+        request.getfixturevalue("resource_organization")
 
-    url = reverse("rule-list")
+    _apply_auth_scenario(api_client, user, resource, scenario)
 
     data = {
         "name": "Rule name",
-        "group": time_span_group.id,
+        "group": resource_time_span_group.id,
         "context": "period",
         "subject": "week",
     }
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        RULE_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
 
 @pytest.mark.django_db
-def test_update_rule_anonymous(
-    api_client, resource, date_period_factory, time_span_group_factory, rule_factory
-):
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-    rule = rule_factory(
-        name="Rule name", group=time_span_group, context="period", subject="week"
-    )
-
-    url = reverse("rule-detail", kwargs={"pk": rule.id})
-
-    data = {
-        "name": "New name",
-    }
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_rule_authenticated_no_org_permission(
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org", 403),
+        ("has_org", 200),
+    ],
+)
+def test_update_rule_permissions(
     api_client,
-    resource,
-    organization_factory,
-    data_source,
-    date_period_factory,
-    time_span_group_factory,
-    rule_factory,
     user,
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-    rule = rule_factory(
-        name="Rule name", group=time_span_group, context="period", subject="week"
-    )
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("rule-detail", kwargs={"pk": rule.id})
-
-    data = {
-        "name": "New name",
-    }
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_rule_authenticated_has_org_permission(
-    api_client,
     resource,
-    organization_factory,
-    data_source,
-    date_period_factory,
-    time_span_group_factory,
+    resource_organization,
+    resource_time_span_group,
     rule_factory,
-    user,
+    scenario,
+    expected_status_code,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
     rule = rule_factory(
-        name="Rule name", group=time_span_group, context="period", subject="week"
+        name="Rule name",
+        group=resource_time_span_group,
+        context="period",
+        subject="week",
     )
 
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    _apply_auth_scenario(api_client, user, resource, scenario)
 
     url = reverse("rule-detail", kwargs={"pk": rule.id})
 
-    data = {
-        "name": "New name",
-    }
-
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=NEW_NAME_JSON,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
-    rule = Rule.objects.get(pk=rule.id)
-    assert rule.name == "New name"
+    rule.refresh_from_db(fields=["name"])
+    assert rule.name == ("New name" if scenario == "has_org" else "Rule name")
 
 
 #
 # TimeSpan
 #
 @pytest.mark.django_db
-def test_create_time_span_anonymous(api_client):
-    url = reverse("time_span-list")
-
-    data = {"name": "Time span name"}
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_time_span_authenticated_no_org_in_resource(
-    api_client, resource, date_period_factory, time_span_group_factory, user
-):
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("time_span-list")
-
-    data = {
-        "name": "Time span name",
-        "group": time_span_group.id,
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_time_span_authenticated_no_org_permission(
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org_in_resource", 400),
+        ("no_org", 403),
+        ("has_org", 201),
+    ],
+)
+def test_create_time_span_permissions(
+    request,
     api_client,
-    organization_factory,
-    data_source,
-    resource,
-    date_period_factory,
-    time_span_group_factory,
     user,
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("time_span-list")
-
-    data = {
-        "name": "Time span name",
-        "group": time_span_group.id,
-    }
-
-    response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_create_time_span_authenticated_has_org_permission(
-    api_client,
-    organization_factory,
-    data_source,
     resource,
-    date_period_factory,
-    time_span_group_factory,
-    user,
+    resource_time_span_group,
+    scenario,
+    expected_status_code,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
+    if scenario != "no_org_in_resource":
+        request.getfixturevalue("resource_organization")
 
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
-
-    url = reverse("time_span-list")
+    _apply_auth_scenario(api_client, user, resource, scenario)
 
     data = {
         "name": "Time span name",
-        "group": time_span_group.id,
+        "group": resource_time_span_group.id,
     }
 
     response = api_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
+        TIME_SPAN_LIST_URL,
+        data=data,
+        format="json",
     )
 
-    assert response.status_code == 201, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_time_span_anonymous(
-    api_client,
-    resource,
-    date_period_factory,
-    time_span_group_factory,
-    time_span_factory,
-):
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-    time_span = time_span_factory(name="Time span name", group=time_span_group)
-
-    url = reverse("time_span-detail", kwargs={"pk": time_span.id})
-
-    data = {
-        "name": "New name",
-    }
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
 
 @pytest.mark.django_db
-def test_update_time_span_authenticated_no_org_permission(
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org", 403),
+        ("has_org", 200),
+    ],
+)
+def test_update_time_span_permissions(
     api_client,
-    resource,
-    organization_factory,
-    data_source,
-    date_period_factory,
-    time_span_group_factory,
-    time_span_factory,
     user,
-):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-    time_span = time_span_factory(name="Time span name", group=time_span_group)
-
-    api_client.force_authenticate(user=user)
-
-    url = reverse("time_span-detail", kwargs={"pk": time_span.id})
-
-    data = {
-        "name": "New name",
-    }
-
-    response = api_client.patch(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 403, "{} {}".format(
-        response.status_code, response.data
-    )
-
-
-@pytest.mark.django_db
-def test_update_time_span_authenticated_has_org_permission(
-    api_client,
     resource,
-    organization_factory,
-    data_source,
-    date_period_factory,
-    time_span_group_factory,
+    resource_organization,
+    resource_time_span_group,
     time_span_factory,
-    user,
+    scenario,
+    expected_status_code,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
+    time_span = time_span_factory(name="Time span name", group=resource_time_span_group)
 
-    date_period = date_period_factory(resource=resource)
-    time_span_group = time_span_group_factory(period=date_period)
-    time_span = time_span_factory(name="Time span name", group=time_span_group)
-
-    organization.regular_users.add(user)
-    api_client.force_authenticate(user=user)
+    _apply_auth_scenario(api_client, user, resource, scenario)
 
     url = reverse("time_span-detail", kwargs={"pk": time_span.id})
 
-    data = {
-        "name": "New name",
-    }
-
     response = api_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=NEW_NAME_JSON,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, expected_status_code)
 
-    time_span = TimeSpan.objects.get(pk=time_span.id)
-    assert time_span.name == "New name"
+    time_span.refresh_from_db(fields=["name"])
+    assert time_span.name == ("New name" if scenario == "has_org" else "Time span name")
 
 
 @pytest.mark.django_db
@@ -3377,9 +2283,7 @@ def test_permission_check_action_anonymous_read(api_client, resource):
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert response.data == {
         "has_permission": True,
@@ -3390,19 +2294,13 @@ def test_permission_check_action_anonymous_read(api_client, resource):
 def test_permission_check_action_anonymous_update(api_client, resource):
     url = reverse("resource-permission-check", kwargs={"pk": resource.id})
 
-    data = {
-        "name": "New name",
-    }
-
     response = api_client.post(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=NEW_NAME_JSON,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert response.data == {
         "has_permission": False,
@@ -3418,42 +2316,25 @@ def test_permission_check_action_anonymous_update(api_client, resource):
     ),
 )
 def test_permission_check_action_authenticated_update(
-    api_client,
+    authenticated_api_client,
     resource,
-    organization_factory,
-    data_source,
+    resource_organization,
     user,
     add_to_org,
     expected_value,
 ):
-    organization = organization_factory(
-        origin_id=12345,
-        data_source=data_source,
-        name="Test organization",
-    )
-    resource.organization = organization
-    resource.save()
-
     if add_to_org:
-        organization.regular_users.add(user)
-
-    api_client.force_authenticate(user=user)
+        resource_organization.regular_users.add(user)
 
     url = reverse("resource-permission-check", kwargs={"pk": resource.id})
 
-    data = {
-        "name": "New name",
-    }
-
-    response = api_client.post(
+    response = authenticated_api_client.post(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=NEW_NAME_JSON,
         content_type="application/json",
     )
 
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
+    assert_response_status_code(response, 200)
 
     assert response.data == {
         "has_permission": expected_value,
@@ -1,12 +1,20 @@
 import datetime
+from calendar import monthrange
 
 import pytest
 from django.urls import reverse
 from django.utils.http import urlencode
 
 from hours.enums import FrequencyModifier, RuleContext, RuleSubject, State, Weekday
-from hours.models import TimeElement
-from hours.tests.conftest import DatePeriodFactory
+from hours.models import (
+    DatePeriod,
+    Resource,
+    Rule,
+    TimeElement,
+    TimeSpan,
+    TimeSpanGroup,
+    get_daily_opening_hours_for_date_periods,
+)
 from hours.tests.utils import TimeSpanGroupBuilder, assert_response_status_code
 
 DEFAULT_YEAR = 2020
@@ -19,9 +27,7 @@ def start_of_month(month, year=DEFAULT_YEAR):
 
 
 def end_of_month(month, year=DEFAULT_YEAR):
-    if month == 12:
-        return datetime.date(year=year, month=month, day=31)
-    return datetime.date(year=year, month=month + 1, day=1) - datetime.timedelta(days=1)
+    return datetime.date(year=year, month=month, day=monthrange(year, month)[1])
 
 
 def _encode_list_of_ids(ids):
@@ -48,7 +54,7 @@ def _post_to_api(
     if date_period_ids is not None:
         data["date_period_ids"] = _encode_list_of_ids(date_period_ids)
 
-    response = client.post(url, QUERY_STRING=urlencode(data))
+    response = client.post(f"{url}?{urlencode(data)}")
 
     return response
 
@@ -131,30 +137,45 @@ def make_closed_date_period(date_period_factory):
     return _make_closed_date_period
 
 
+def get_resource_opening_hours(resource, start_date, end_date):
+    # Prefetch the rows of all the periods instead of querying them per period
+    date_periods = resource.date_periods.prefetch_related(
+        "time_span_groups__rules", "time_span_groups__time_spans"
+    )
+    return get_daily_opening_hours_for_date_periods(date_periods, start_date, end_date)
+
+
 def assert_all_date_period_opening_hours_in_resource_opening_hours(
     resource,
     date_period,
     start_date=DEFAULT_START_OF_YEAR,
     end_date=DEFAULT_END_OF_YEAR,
+    resource_opening_hours=None,
 ):
     """
     Assert that all the date period opening hours are found
     in the resource opening hours, i.e. the date period
     opening hours are a subset of the resource opening hours.
+
+    The resource opening hours for the same date range can be passed in
+    to avoid computing them again.
     """
     date_period_opening_hours = date_period.get_daily_opening_hours(
         start_date=start_date, end_date=end_date
     )
-    resource_opening_hours = resource.get_daily_opening_hours(
-        start_date=start_date, end_date=end_date
-    )
+    if resource_opening_hours is None:
+        resource_opening_hours = get_resource_opening_hours(
+            resource, start_date=start_date, end_date=end_date
+        )
 
-    for date in date_period_opening_hours:
-        assert date in resource_opening_hours
-        assert date_period_opening_hours[date] == resource_opening_hours[date], (
-            f"Resource opening hours for date {date} "
-            f"should match date period opening hours"
+    assert date_period_opening_hours.items() <= resource_opening_hours.items(), (
+        "Resource opening hours should match date period opening hours for dates "
+        + ", ".join(
+            str(date)
+            for date, opening_hours in date_period_opening_hours.items()
+            if resource_opening_hours.get(date) != opening_hours
         )
+    )
 
 
 def assert_date_period_opening_hours_not_in_resource_opening_hours(
@@ -162,95 +183,140 @@ def assert_date_period_opening_hours_not_in_resource_opening_hours(
     date_period,
     start_date=DEFAULT_START_OF_YEAR,
     end_date=DEFAULT_END_OF_YEAR,
+    resource_opening_hours=None,
 ):
     """
     Assert that none of the opening hours of the date period are
     found in the opening hours of the resource, i.e. there is
     no overlap between the two.
+
+    The resource opening hours for the same date range can be passed in
+    to avoid computing them again.
     """
     date_period_opening_hours = date_period.get_daily_opening_hours(
         start_date=start_date, end_date=end_date
     )
-    resource_opening_hours = resource.get_daily_opening_hours(
-        start_date=start_date, end_date=end_date
-    )
+    if resource_opening_hours is None:
+        resource_opening_hours = get_resource_opening_hours(
+            resource, start_date=start_date, end_date=end_date
+        )
 
-    for date in date_period_opening_hours:
-        if date in resource_opening_hours:
-            assert date_period_opening_hours[date] != resource_opening_hours[date], (
-                f"Resource opening hours for date {date} "
-                f"should not match date period opening hours"
-            )
+    assert date_period_opening_hours.items().isdisjoint(
+        resource_opening_hours.items()
+    ), (
+        "Resource opening hours should not match date period opening hours for dates "
+        + ", ".join(
+            str(date)
+            for date, opening_hours in date_period_opening_hours.items()
+            if resource_opening_hours.get(date) == opening_hours
+        )
+    )
 
 
 def create_test_periods(resource):
-    date_period = DatePeriodFactory(
-        resource=resource,
-        resource_state=State.OPEN,
-        start_date=DEFAULT_START_OF_YEAR,
-        end_date=DEFAULT_END_OF_YEAR,
-    )
-
-    DatePeriodFactory(
-        resource=resource,
-        resource_state=State.CLOSED,
-        start_date=DEFAULT_START_OF_YEAR,
-        end_date=DEFAULT_END_OF_YEAR,
-        override=True,
-        is_removed=True,
+    date_period, _ = DatePeriod.objects.bulk_create(
+        [
+            DatePeriod(
+                resource=resource,
+                resource_state=State.OPEN,
+                start_date=DEFAULT_START_OF_YEAR,
+                end_date=DEFAULT_END_OF_YEAR,
+            ),
+            DatePeriod(
+                resource=resource,
+                resource_state=State.CLOSED,
+                start_date=DEFAULT_START_OF_YEAR,
+                end_date=DEFAULT_END_OF_YEAR,
+                override=True,
+                is_removed=True,
+            ),
+        ]
     )
 
-    TimeSpanGroupBuilder(date_period).with_rule(
+    time_span_group = TimeSpanGroup.objects.create(period=date_period)
+    Rule.objects.create(
+        group=time_span_group,
         context=RuleContext.PERIOD,
         subject=RuleSubject.DAY,
         frequency_modifier=FrequencyModifier.EVEN,
-    ).with_time_span(
-        start_time=datetime.time(8),
-        end_time=datetime.time(16),
-        weekdays=Weekday.business_days(),
-    ).with_time_span(
-        start_time=datetime.time(10),
-        end_time=datetime.time(14),
-        weekdays=Weekday.weekend(),
-    ).create()
+    )
+    TimeSpan.objects.bulk_create(
+        [
+            TimeSpan(
+                group=time_span_group,
+                start_time=datetime.time(8),
+                end_time=datetime.time(16),
+                weekdays=Weekday.business_days(),
+            ),
+            TimeSpan(
+                group=time_span_group,
+                start_time=datetime.time(10),
+                end_time=datetime.time(14),
+                weekdays=Weekday.weekend(),
+            ),
+        ]
+    )
+
+    # bulk_create doesn't send post_save, which would update these
+    resource.update_denormalized_date_periods_data()
+
+
+@pytest.fixture
+def resource_test_periods(resource):
+    create_test_periods(resource)
 
 
 def check_opening_hours_same(resource1, resource2, start_date, end_date):
-    resource2.refresh_from_db()
-    resource1_opening_hours = resource1.get_daily_opening_hours(start_date, end_date)
-    resource2_opening_hours = resource2.get_daily_opening_hours(start_date, end_date)
+    resource2.refresh_from_db(fields=["date_periods_hash", "date_periods_as_text"])
 
-    assert resource2_opening_hours == resource1_opening_hours
+    # Compare the stored data first, it fails without computing opening hours
     assert resource2.date_periods_hash == resource1.date_periods_hash
     assert resource2.date_periods_as_text == resource1.date_periods_as_text
 
+    resource1_opening_hours = get_resource_opening_hours(
+        resource1, start_date, end_date
+    )
+    resource2_opening_hours = get_resource_opening_hours(
+        resource2, start_date, end_date
+    )
+
+    assert resource2_opening_hours == resource1_opening_hours
+
 
 def check_opening_hours_not_same(resource1, resource2, start_date, end_date):
-    resource1_opening_hours = resource1.get_daily_opening_hours(start_date, end_date)
-    resource2_opening_hours = resource2.get_daily_opening_hours(start_date, end_date)
+    resource2.refresh_from_db(fields=["date_periods_hash", "date_periods_as_text"])
 
-    assert resource1_opening_hours != resource2_opening_hours
     assert resource1.date_periods_hash != resource2.date_periods_hash
     assert resource1.date_periods_as_text != resource2.date_periods_as_text
 
+    resource1_opening_hours = get_resource_opening_hours(
+        resource1, start_date, end_date
+    )
+    resource2_opening_hours = get_resource_opening_hours(
+        resource2, start_date, end_date
+    )
+
+    assert resource1_opening_hours != resource2_opening_hours
+
 
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 def test_copy_all_periods_to_resource_copy_to_self_prevented(resource):
-    create_test_periods(resource)
-
-    assert resource.date_periods.count() == 1
     resource.copy_periods_to_resource(resource)
     assert resource.date_periods.count() == 1
 
 
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 def test_copy_all_periods_to_resource_with_no_date_periods(
     resource,
     resource_factory,
+    django_assert_max_num_queries,
 ):
-    create_test_periods(resource)
     resource2 = resource_factory()
-    resource.copy_periods_to_resource(resource2)
+    # The current query count, to catch copying turning into N+1 queries
+    with django_assert_max_num_queries(64):
+        resource.copy_periods_to_resource(resource2)
 
     assert resource2.date_periods.count() == 1
     check_opening_hours_same(
@@ -261,13 +327,14 @@ def test_copy_all_periods_to_resource_with_no_date_periods(
     )
 
 
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 def test_copy_all_periods_to_resource_replace(
     resource,
     resource_factory,
     date_period_factory,
+    django_assert_max_num_queries,
 ):
-    create_test_periods(resource)
     resource2 = resource_factory()
 
     date_period_factory(
@@ -278,7 +345,9 @@ def test_copy_all_periods_to_resource_replace(
         override=True,
     )
 
-    resource.copy_periods_to_resource(resource2, replace=True)
+    # The current query count, to catch copying turning into N+1 queries
+    with django_assert_max_num_queries(90):
+        resource.copy_periods_to_resource(resource2, replace=True)
 
     assert resource2.date_periods.count() == 1
     check_opening_hours_same(
@@ -289,13 +358,49 @@ def test_copy_all_periods_to_resource_replace(
     )
 
 
+BUSINESS_DAY_OPENING_HOURS = TimeElement(
+    start_time=datetime.time(8, 0),
+    end_time_on_next_day=False,
+    end_time=datetime.time(16, 0),
+    resource_state=State.OPEN,
+    override=False,
+    full_day=False,
+)
+CLOSED_FULL_DAY = TimeElement(
+    start_time=None,
+    end_time_on_next_day=False,
+    end_time=None,
+    resource_state=State.CLOSED,
+    override=True,
+    full_day=True,
+)
+EXISTING_PERIODS_COPY_OPENING_HOURS = {
+    datetime.date(2020, 10, 12): [BUSINESS_DAY_OPENING_HOURS],
+    datetime.date(2020, 10, 13): [CLOSED_FULL_DAY],
+    datetime.date(2020, 10, 14): [CLOSED_FULL_DAY],
+    datetime.date(2020, 10, 15): [CLOSED_FULL_DAY],
+    datetime.date(2020, 10, 16): [BUSINESS_DAY_OPENING_HOURS],
+    datetime.date(2020, 10, 18): [
+        TimeElement(
+            start_time=datetime.time(10, 0),
+            end_time_on_next_day=False,
+            end_time=datetime.time(14, 0),
+            resource_state=State.OPEN,
+            override=False,
+            full_day=False,
+        )
+    ],
+}
+
+
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 def test_copy_all_periods_to_resource_with_existing_date_periods(
     resource,
     resource_factory,
     date_period_factory,
+    django_assert_max_num_queries,
 ):
-    create_test_periods(resource)
     resource2 = resource_factory()
 
     date_period_factory(
@@ -306,75 +411,17 @@ def test_copy_all_periods_to_resource_with_existing_date_periods(
         override=True,
     )
 
-    resource.copy_periods_to_resource(resource2)
+    # The current query count, to catch copying turning into N+1 queries
+    with django_assert_max_num_queries(74):
+        resource.copy_periods_to_resource(resource2)
 
     assert resource2.date_periods.count() == 2
-    resource2_opening_hours = resource2.get_daily_opening_hours(
+    resource2_opening_hours = get_resource_opening_hours(
+        resource2,
         datetime.date(year=2020, month=10, day=12),
         datetime.date(year=2020, month=10, day=18),
     )
-    assert resource2_opening_hours == {
-        datetime.date(2020, 10, 12): [
-            TimeElement(
-                start_time=datetime.time(8, 0),
-                end_time_on_next_day=False,
-                end_time=datetime.time(16, 0),
-                resource_state=State.OPEN,
-                override=False,
-                full_day=False,
-            )
-        ],
-        datetime.date(2020, 10, 13): [
-            TimeElement(
-                start_time=None,
-                end_time_on_next_day=False,
-                end_time=None,
-                resource_state=State.CLOSED,
-                override=True,
-                full_day=True,
-            )
-        ],
-        datetime.date(2020, 10, 14): [
-            TimeElement(
-                start_time=None,
-                end_time_on_next_day=False,
-                end_time=None,
-                resource_state=State.CLOSED,
-                override=True,
-                full_day=True,
-            )
-        ],
-        datetime.date(2020, 10, 15): [
-            TimeElement(
-                start_time=None,
-                end_time_on_next_day=False,
-                end_time=None,
-                resource_state=State.CLOSED,
-                override=True,
-                full_day=True,
-            )
-        ],
-        datetime.date(2020, 10, 16): [
-            TimeElement(
-                start_time=datetime.time(8, 0),
-                end_time_on_next_day=False,
-                end_time=datetime.time(16, 0),
-                resource_state=State.OPEN,
-                override=False,
-                full_day=False,
-            )
-        ],
-        datetime.date(2020, 10, 18): [
-            TimeElement(
-                start_time=datetime.time(10, 0),
-                end_time_on_next_day=False,
-                end_time=datetime.time(14, 0),
-                resource_state=State.OPEN,
-                override=False,
-                full_day=False,
-            )
-        ],
-    }
+    assert resource2_opening_hours == EXISTING_PERIODS_COPY_OPENING_HOURS
 
 
 # API
@@ -387,6 +434,7 @@ def test_resource_api_copy_periods_to_resource_with_period_ids_and_replace(
     make_date_period_with_regular_opening_hours,
     make_date_period_with_summer_opening_hours,
     make_closed_date_period,
+    django_assert_max_num_queries,
 ):
     # Create a source resource with two date periods.
     source_resource = resource_factory()
@@ -398,13 +446,15 @@ def test_resource_api_copy_periods_to_resource_with_period_ids_and_replace(
     make_closed_date_period(target_resource)
 
     # Copy the summer date period from the source resource to the target resource.
-    response = _post_to_api(
-        admin_client,
-        source_resource.id,
-        target_resource.id,
-        date_period_ids=[summer_date_period.id],
-        replace=True,
-    )
+    # The query count cap catches copying turning into N+1 queries.
+    with django_assert_max_num_queries(35):
+        response = _post_to_api(
+            admin_client,
+            source_resource.id,
+            target_resource.id,
+            date_period_ids=[summer_date_period.id],
+            replace=True,
+        )
 
     assert_response_status_code(response, 200)
 
@@ -413,11 +463,12 @@ def test_resource_api_copy_periods_to_resource_with_period_ids_and_replace(
     # Assert that the target resource has only the source resource's summer date period.
     assert target_resource.date_periods.count() == 1
 
+    # The summer period is the only one left, so only the summer has opening hours
     summer_period_opening_hours = summer_date_period.get_daily_opening_hours(
-        DEFAULT_START_OF_YEAR, DEFAULT_END_OF_YEAR
+        start_of_month(6), end_of_month(8)
     )
-    target_resource_opening_hours = target_resource.get_daily_opening_hours(
-        DEFAULT_START_OF_YEAR, DEFAULT_END_OF_YEAR
+    target_resource_opening_hours = get_resource_opening_hours(
+        target_resource, start_of_month(6), end_of_month(8)
     )
 
     assert target_resource_opening_hours == summer_period_opening_hours
@@ -434,6 +485,7 @@ def test_resource_api_copy_periods_to_resource_with_period_ids(
     make_date_period_with_regular_opening_hours,
     make_date_period_with_summer_opening_hours,
     make_closed_date_period,
+    django_assert_max_num_queries,
 ):
     # Create a source resource with two date periods.
     source_resource = resource_factory()
@@ -444,13 +496,15 @@ def test_resource_api_copy_periods_to_resource_with_period_ids(
     target_resource = resource_factory()
     target_resource_date_period = make_closed_date_period(target_resource)
 
-    # Copy the second date period to the target resource.
-    response = _post_to_api(
-        admin_client,
-        source_resource.id,
-        target_resource.id,
-        date_period_ids=[second_date_period.id],
-    )
+    # Copy the second date period to the target resource. The query count cap
+    # catches copying turning into N+1 queries.
+    with django_assert_max_num_queries(33):
+        response = _post_to_api(
+            admin_client,
+            source_resource.id,
+            target_resource.id,
+            date_period_ids=[second_date_period.id],
+        )
 
     assert_response_status_code(response, 200)
 
@@ -459,8 +513,13 @@ def test_resource_api_copy_periods_to_resource_with_period_ids(
     # Assert that the target resource has its original
     # date period and the source resource's second date period.
     assert target_resource.date_periods.count() == 2
+    target_resource_opening_hours = get_resource_opening_hours(
+        target_resource, DEFAULT_START_OF_YEAR, DEFAULT_END_OF_YEAR
+    )
     assert_all_date_period_opening_hours_in_resource_opening_hours(
-        target_resource, second_date_period
+        target_resource,
+        second_date_period,
+        resource_opening_hours=target_resource_opening_hours,
     )
     assert second_date_period.as_text() in target_resource.date_periods_as_text
     assert target_resource_date_period.as_text() in target_resource.date_periods_as_text
@@ -469,10 +528,13 @@ def test_resource_api_copy_periods_to_resource_with_period_ids(
     # not have the source resource's first date period.
     assert first_date_period.as_text() not in target_resource.date_periods_as_text
     assert_date_period_opening_hours_not_in_resource_opening_hours(
-        target_resource, first_date_period
+        target_resource,
+        first_date_period,
+        resource_opening_hours=target_resource_opening_hours,
     )
 
 
+@pytest.mark.parametrize("existing_date_period_count", [0, 10])
 @pytest.mark.parametrize(
     "date_period_ids",
     [
@@ -481,42 +543,21 @@ def test_resource_api_copy_periods_to_resource_with_period_ids(
     ],
 )
 @pytest.mark.django_db
-def test_resource_api_copy_periods_to_resource_with_period_ids_all_missing(
+def test_resource_api_copy_periods_to_resource_with_period_ids_missing(
     date_period_ids,
+    existing_date_period_count,
     admin_client,
     resource_factory,
 ):
     source_resource = resource_factory()
     target_resource = resource_factory()
-
-    response = _post_to_api(
-        admin_client,
-        source_resource.id,
-        target_resource.id,
-        date_period_ids=date_period_ids,
+    date_periods = DatePeriod.objects.bulk_create(
+        [
+            DatePeriod(resource=source_resource)
+            for _ in range(existing_date_period_count)
+        ]
     )
 
-    assert_response_status_code(response, 404)
-
-
-@pytest.mark.parametrize(
-    "date_period_ids",
-    [
-        [-1],
-        [-1, -2],
-    ],
-)
-@pytest.mark.django_db
-def test_copy_periods_to_resource_with_period_ids_some_missing(
-    date_period_ids,
-    admin_client,
-    resource_factory,
-    date_period_factory,
-):
-    source_resource = resource_factory()
-    target_resource = resource_factory()
-    date_periods = date_period_factory.create_batch(10, resource=source_resource)
-
     response = _post_to_api(
         admin_client,
         source_resource.id,
@@ -537,58 +578,46 @@ def test_resource_api_copy_date_periods_parameter_missing(admin_client, resource
     assert_response_status_code(response, 400)
 
 
-@pytest.mark.django_db
-def test_resource_api_copy_date_periods_admin_user(admin_client, resource_factory):
-    resource1 = resource_factory()
-    resource2 = resource_factory()
-    create_test_periods(resource1)
-
-    response = _post_to_api(admin_client, resource1.id, resource2.id)
-
-    assert_response_status_code(response, 200)
-    check_opening_hours_same(
-        resource1,
-        resource2,
-        start_date=datetime.date(year=2020, month=10, day=12),
-        end_date=datetime.date(year=2020, month=10, day=18),
-    )
-
-
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 def test_resource_api_copy_date_periods_admin_user_one_target_missing(
-    admin_client, resource_factory
+    admin_client, resource, resource_factory
 ):
-    resource1 = resource_factory()
     resource2 = resource_factory()
-    create_test_periods(resource1)
 
-    response = _post_to_api(admin_client, resource1.id, [resource2.id, 12345])
+    response = _post_to_api(admin_client, resource.id, [resource2.id, 12345])
 
     assert_response_status_code(response, 404)
 
 
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
-@pytest.mark.parametrize("with_replace", [False, True])
-def test_resource_api_copy_date_periods_admin_user_replace(
-    admin_client, resource_factory, with_replace
+@pytest.mark.parametrize("with_replace", [None, False, True])
+def test_resource_api_copy_date_periods_admin_user(
+    admin_client,
+    resource,
+    resource_factory,
+    with_replace,
+    django_assert_max_num_queries,
 ):
-    resource1 = resource_factory()
     resource2 = resource_factory()
-    create_test_periods(resource1)
 
-    response = _post_to_api(
-        admin_client, resource1.id, resource2.id, replace=with_replace
-    )
+    # The current query count, to catch copying turning into N+1 queries
+    with django_assert_max_num_queries(35):
+        response = _post_to_api(
+            admin_client, resource.id, resource2.id, replace=with_replace
+        )
 
     assert_response_status_code(response, 200)
     check_opening_hours_same(
-        resource1,
+        resource,
         resource2,
         start_date=datetime.date(year=2020, month=10, day=12),
         end_date=datetime.date(year=2020, month=10, day=18),
     )
 
 
+@pytest.mark.usefixtures("resource_test_periods")
 @pytest.mark.django_db
 @pytest.mark.parametrize("with_data_source_id", [False, True])
 def test_resource_api_copy_date_periods_admin_user_copy_to_self_prevented(
@@ -603,8 +632,6 @@ def test_resource_api_copy_date_periods_admin_user_copy_to_self_prevented(
         )
         target_resources = "{}:{}".format(data_source.id, resource_origin.origin_id)
 
-    create_test_periods(resource)
-
     response = _post_to_api(admin_client, resource.id, target_resources)
 
     assert_response_status_code(response, 500)
@@ -612,124 +639,52 @@ def test_resource_api_copy_date_periods_admin_user_copy_to_self_prevented(
 
 
 @pytest.mark.django_db
-@pytest.mark.parametrize("with_user", [False, True])
-def test_resource_api_copy_date_periods_no_org(
-    client, user, resource_factory, with_user
+@pytest.mark.parametrize(
+    "scenario, expected_status_code",
+    [
+        ("anonymous", 403),
+        ("no_org", 403),
+        ("same_org", 200),
+        ("different_from_org", 200),
+        ("different_from_org_non_public", 404),
+        ("different_to_org", 403),
+    ],
+)
+def test_resource_api_copy_date_periods_permissions(
+    client, organization_factory, resource_factory, user, scenario, expected_status_code
 ):
-    if with_user:
+    if scenario != "anonymous":
         client.force_login(user)
 
-    resource1 = resource_factory()
-    resource2 = resource_factory()
-    create_test_periods(resource1)
-
-    response = _post_to_api(client, resource1.id, resource2.id)
-
-    assert_response_status_code(response, 403)
-    check_opening_hours_not_same(
-        resource1,
-        resource2,
-        start_date=datetime.date(year=2020, month=10, day=12),
-        end_date=datetime.date(year=2020, month=10, day=18),
-    )
-
-
-@pytest.mark.django_db
-def test_resource_api_copy_date_periods_same_org(
-    client, organization_factory, resource_factory, user
-):
-    client.force_login(user)
-
-    organization1 = organization_factory()
-    organization1.regular_users.add(user)
-
-    resource1 = resource_factory(organization=organization1)
-    resource2 = resource_factory(organization=organization1)
-
-    create_test_periods(resource1)
-
-    response = _post_to_api(client, resource1.id, resource2.id)
-
-    assert_response_status_code(response, 200)
-    check_opening_hours_same(
-        resource1,
-        resource2,
-        start_date=datetime.date(year=2020, month=10, day=12),
-        end_date=datetime.date(year=2020, month=10, day=18),
-    )
-
-
-@pytest.mark.django_db
-def test_resource_api_copy_date_periods_different_from_org(
-    client, organization_factory, resource_factory, user
-):
-    client.force_login(user)
-
-    organization1 = organization_factory()
-    organization2 = organization_factory()
-    organization2.regular_users.add(user)
-
-    resource1 = resource_factory(organization=organization1)
-    resource2 = resource_factory(organization=organization2)
-
-    create_test_periods(resource1)
-
-    response = _post_to_api(client, resource1.id, resource2.id)
-
-    assert_response_status_code(response, 200)
-    check_opening_hours_same(
-        resource1,
-        resource2,
-        start_date=datetime.date(year=2020, month=10, day=12),
-        end_date=datetime.date(year=2020, month=10, day=18),
-    )
-
-
-@pytest.mark.django_db
-def test_resource_api_copy_date_periods_different_from_org_non_public(
-    client, organization_factory, resource_factory, user
-):
-    client.force_login(user)
-
-    organization1 = organization_factory()
-    organization2 = organization_factory()
-    organization2.regular_users.add(user)
-
-    resource1 = resource_factory(organization=organization1, is_public=False)
-    resource2 = resource_factory(organization=organization2)
+    if scenario in ["anonymous", "no_org"]:
+        resource1, resource2 = resource_factory.create_batch(2)
+    else:
+        organization1, organization2 = organization_factory.create_batch(2)
+        # When copying from another org, the user is only a member of the target's org
+        if scenario.startswith("different_from_org"):
+            organization2.regular_users.add(user)
+        else:
+            organization1.regular_users.add(user)
+
+        resource1 = resource_factory(
+            organization=organization1,
+            is_public=scenario != "different_from_org_non_public",
+        )
+        resource2 = resource_factory(
+            organization=organization1 if scenario == "same_org" else organization2
+        )
 
     create_test_periods(resource1)
 
     response = _post_to_api(client, resource1.id, resource2.id)
 
-    assert_response_status_code(response, 404)
-    check_opening_hours_not_same(
-        resource1,
-        resource2,
-        start_date=datetime.date(year=2020, month=10, day=12),
-        end_date=datetime.date(year=2020, month=10, day=18),
+    assert_response_status_code(response, expected_status_code)
+    check_opening_hours = (
+        check_opening_hours_same
+        if expected_status_code == 200
+        else check_opening_hours_not_same
     )
-
-
-@pytest.mark.django_db
-def test_resource_api_copy_date_periods_different_to_org(
-    client, organization_factory, resource_factory, user
-):
-    client.force_login(user)
-
-    organization1 = organization_factory()
-    organization1.regular_users.add(user)
-    organization2 = organization_factory()
-
-    resource1 = resource_factory(organization=organization1)
-    resource2 = resource_factory(organization=organization2)
-
-    create_test_periods(resource1)
-
-    response = _post_to_api(client, resource1.id, resource2.id)
-
-    assert_response_status_code(response, 403)
-    check_opening_hours_not_same(
+    check_opening_hours(
         resource1,
         resource2,
         start_date=datetime.date(year=2020, month=10, day=12),
@@ -739,7 +694,7 @@ def test_resource_api_copy_date_periods_different_to_org(
 
 @pytest.mark.django_db
 def test_resource_api_copy_date_periods_to_multiple(
-    client, organization_factory, resource_factory, user
+    client, organization_factory, user, django_assert_max_num_queries
 ):
     client.force_login(user)
 
@@ -747,14 +702,16 @@ def test_resource_api_copy_date_periods_to_multiple(
     organization1.regular_users.add(user)
 
     # Create multiple resources, use the first one as the source resource.
-    source_resource, *target_resources = resource_factory.create_batch(
-        4, organization=organization1
+    source_resource, *target_resources = Resource.objects.bulk_create(
+        [Resource(name=f"Resource {i}", organization=organization1) for i in range(4)]
     )
     create_test_periods(source_resource)
 
-    response = _post_to_api(
-        client, source_resource.id, [r.id for r in target_resources]
-    )
+    # The current query count, to catch copying turning into N+1 queries
+    with django_assert_max_num_queries(118):
+        response = _post_to_api(
+            client, source_resource.id, [r.id for r in target_resources]
+        )
 
     assert_response_status_code(response, 200)
     for target_resource in target_resources:
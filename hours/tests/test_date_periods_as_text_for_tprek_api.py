@@ -4,8 +4,11 @@ import pytest
 from django.urls import reverse
 from freezegun import freeze_time
 
+from hours.models import DatePeriod, TimeSpan, TimeSpanGroup
+
 
 @pytest.mark.django_db
+@freeze_time("2020-10-17 12:00:00+02:00")
 def test_test_date_periods_as_text_for_tprek_api_with_hours(
     admin_client,
     data_source_factory,
@@ -33,11 +36,10 @@ def test_test_date_periods_as_text_for_tprek_api_with_hours(
 
     url = reverse("date_periods_as_text_for_tprek-list")
 
-    with freeze_time("2020-10-17 12:00:00+02:00"):
-        response = admin_client.get(
-            url,
-            content_type="application/json",
-        )
+    response = admin_client.get(
+        url,
+        content_type="application/json",
+    )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -51,13 +53,12 @@ def test_test_date_periods_as_text_for_tprek_api_with_hours(
 
 
 @pytest.mark.django_db
+@freeze_time("2020-10-17 12:00:00+02:00")
 def test_test_date_periods_as_text_for_tprek_api_with_past_date_periods(
     admin_client,
     data_source_factory,
     resource_origin_factory,
     resource,
-    date_period_factory,
-    time_span_group_factory,
     time_span_factory,
     django_assert_num_queries,
 ):
@@ -68,32 +69,38 @@ def test_test_date_periods_as_text_for_tprek_api_with_past_date_periods(
         data_source=data_source,
     )
 
-    period1 = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2019, month=1, day=1),
-        end_date=datetime.date(year=2019, month=12, day=31),
+    periods = DatePeriod.objects.bulk_create(
+        [
+            DatePeriod(
+                resource=resource,
+                name="Testperiod",
+                start_date=datetime.date(year=2019, month=1, day=1),
+                end_date=datetime.date(year=2019, month=12, day=31),
+            ),
+            DatePeriod(
+                resource=resource,
+                name="Testperiod",
+                start_date=datetime.date(year=2020, month=1, day=1),
+                end_date=datetime.date(year=2020, month=12, day=31),
+            ),
+        ]
     )
-    time_span_group = time_span_group_factory(period=period1)
-    time_span_factory(group=time_span_group)
-
-    period2 = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2020, month=1, day=1),
-        end_date=datetime.date(year=2020, month=12, day=31),
+    time_span_groups = TimeSpanGroup.objects.bulk_create(
+        [TimeSpanGroup(period=period) for period in periods]
     )
-    time_span_group = time_span_group_factory(period=period2)
-    time_span_factory(group=time_span_group)
+    TimeSpan.objects.bulk_create(
+        [time_span_factory.build(group=group) for group in time_span_groups]
+    )
+    # bulk_create doesn't send post_save, which would update these
+    resource.update_denormalized_date_periods_data()
 
     url = reverse("date_periods_as_text_for_tprek-list")
 
     with django_assert_num_queries(10):
-        with freeze_time("2020-10-17 12:00:00+02:00"):
-            response = admin_client.get(
-                url,
-                content_type="application/json",
-            )
+        response = admin_client.get(
+            url,
+            content_type="application/json",
+        )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -1,20 +1,22 @@
 import datetime
-import json
 
 import pytest
-from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 
 from hours.enums import RuleContext, RuleSubject, State, Weekday
 from hours.models import DatePeriod
 from hours.tests.utils import assert_response_status_code
 
+DATE_PERIOD_LIST_URL = reverse("date_period-list")
+TIME_SPAN_LIST_URL = reverse("time_span-list")
 
-@pytest.mark.django_db
-def test_list_date_periods_empty(admin_client):
-    url = reverse("date_period-list")
 
-    response = admin_client.get(url, data={"start_date_lte": "2030-01-01"})
+@pytest.mark.django_db
+def test_list_date_periods_empty(admin_client, django_assert_max_num_queries):
+    with django_assert_max_num_queries(3):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL, data={"start_date_lte": "2030-01-01"}
+        )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -24,7 +26,9 @@ def test_list_date_periods_empty(admin_client):
 
 
 @pytest.mark.django_db
-def test_list_date_periods_one_date_period(admin_client, resource, date_period_factory):
+def test_list_date_periods_one_date_period(
+    admin_client, resource, date_period_factory, django_assert_max_num_queries
+):
     date_period = date_period_factory(
         resource=resource,
         name="Testperiod",
@@ -32,9 +36,10 @@ def test_list_date_periods_one_date_period(admin_client, resource, date_period_f
         end_date=None,
     )
 
-    url = reverse("date_period-list")
-
-    response = admin_client.get(url, data={"start_date_lte": "2030-01-01"})
+    with django_assert_max_num_queries(5):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL, data={"start_date_lte": "2030-01-01"}
+        )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -46,24 +51,29 @@ def test_list_date_periods_one_date_period(admin_client, resource, date_period_f
 
 @pytest.mark.django_db
 def test_list_date_periods_multiple_date_periods(
-    admin_client, resource, date_period_factory
+    admin_client, resource, django_assert_max_num_queries
 ):
-    date_period = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2020, month=1, day=1),
-        end_date=None,
-    )
-    date_period2 = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=None,
-        end_date=datetime.date(year=2020, month=1, day=1),
-    )
-
-    url = reverse("date_period-list")
-
-    response = admin_client.get(url, data={"start_date_lte": "2030-01-01"})
+    date_period, date_period2 = DatePeriod.objects.bulk_create(
+        [
+            DatePeriod(
+                resource=resource,
+                name="Testperiod",
+                start_date=datetime.date(year=2020, month=1, day=1),
+                end_date=None,
+            ),
+            DatePeriod(
+                resource=resource,
+                name="Testperiod",
+                start_date=None,
+                end_date=datetime.date(year=2020, month=1, day=1),
+            ),
+        ]
+    )
+
+    with django_assert_max_num_queries(5):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL, data={"start_date_lte": "2030-01-01"}
+        )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -77,39 +87,65 @@ def test_list_date_periods_multiple_date_periods(
 
 
 @pytest.mark.django_db
-def test_list_date_periods_filter_by_resource(
-    admin_client, resource_factory, date_period_factory
+@pytest.mark.parametrize(
+    "filter_name, expected_index",
+    [
+        ("resource", 0),
+        ("start_date_lte", 1),
+        ("end_date_gte", 0),
+    ],
+)
+def test_list_date_periods_filter(
+    admin_client,
+    resource_factory,
+    django_assert_max_num_queries,
+    filter_name,
+    expected_index,
 ):
     resource = resource_factory()
     resource2 = resource_factory()
-    date_period = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2020, month=1, day=1),
-        end_date=None,
-    )
-    date_period_factory(
-        resource=resource2,
-        name="Testperiod",
-        start_date=None,
-        end_date=datetime.date(year=2020, month=1, day=1),
-    )
-
-    url = reverse("date_period-list")
+    date_periods = DatePeriod.objects.bulk_create(
+        [
+            DatePeriod(
+                resource=resource,
+                name="Testperiod",
+                start_date=datetime.date(year=2020, month=1, day=1),
+                end_date=None,
+            ),
+            DatePeriod(
+                resource=resource2,
+                name="Testperiod",
+                start_date=None,
+                end_date=datetime.date(year=2020, month=1, day=1),
+            ),
+        ]
+    )
+    filter_values = {
+        "resource": resource.id,
+        "start_date_lte": "2019-01-01",
+        "end_date_gte": "2021-01-01",
+    }
 
-    response = admin_client.get(url, data={"resource": resource.id})
+    with django_assert_max_num_queries(5):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL, data={filter_name: filter_values[filter_name]}
+        )
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
     )
 
     assert len(response.data) == 1
-    assert response.data[0]["id"] == date_period.id
+    assert response.data[0]["id"] == date_periods[expected_index].id
 
 
 @pytest.mark.django_db
 def test_list_date_periods_filter_by_data_source(
-    admin_client, resource, data_source_factory, date_period_factory
+    admin_client,
+    resource,
+    data_source_factory,
+    date_period_factory,
+    django_assert_max_num_queries,
 ):
     expected_data_source = data_source_factory()
     expected_date_period = date_period_factory(
@@ -121,11 +157,11 @@ def test_list_date_periods_filter_by_data_source(
         data_sources=[data_source_factory()],
     )
 
-    url = reverse("date_period-list")
-
-    response = admin_client.get(
-        url, data={"resource": resource.id, "data_source": [expected_data_source.id]}
-    )
+    with django_assert_max_num_queries(6):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL,
+            data={"resource": resource.id, "data_source": [expected_data_source.id]},
+        )
 
     assert_response_status_code(response, 200)
     assert len(response.data) == 1
@@ -134,7 +170,12 @@ def test_list_date_periods_filter_by_data_source(
 
 @pytest.mark.django_db
 def test_list_date_periods_filter_by_resource_direct_data_source(
-    admin_client, resource, data_source_factory, date_period_factory, resource_factory
+    admin_client,
+    resource,
+    data_source_factory,
+    date_period_factory,
+    resource_factory,
+    django_assert_max_num_queries,
 ):
     expected_data_source = data_source_factory()
     resource.data_sources.add(expected_data_source)
@@ -146,15 +187,14 @@ def test_list_date_periods_filter_by_resource_direct_data_source(
         start_date=datetime.date(year=2024, month=1, day=1),
     )
 
-    url = reverse("date_period-list")
-
-    response = admin_client.get(
-        url,
-        data={
-            "resource_data_source": expected_data_source.id,
-            "start_date_lte": "2024-01-05",
-        },
-    )
+    with django_assert_max_num_queries(5):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL,
+            data={
+                "resource_data_source": expected_data_source.id,
+                "start_date_lte": "2024-01-05",
+            },
+        )
 
     assert_response_status_code(response, 200)
     assert len(response.data) == 1
@@ -169,6 +209,7 @@ def test_list_date_periods_filter_by_resource_data_source_ancestor(
     date_period_factory,
     resource_factory,
     resource_origin_factory,
+    django_assert_max_num_queries,
 ):
     expected_data_source = data_source_factory()
     resource.data_sources.add(expected_data_source)
@@ -188,83 +229,22 @@ def test_list_date_periods_filter_by_resource_data_source_ancestor(
         end_date=datetime.date(year=2024, month=5, day=31),
     )
 
-    url = reverse("date_period-list")
-
-    response = admin_client.get(
-        url,
-        data={
-            "resource_data_source": expected_data_source.id,
-            "start_date_gte": "2024-01-01",
-        },
-    )
+    with django_assert_max_num_queries(5):
+        response = admin_client.get(
+            DATE_PERIOD_LIST_URL,
+            data={
+                "resource_data_source": expected_data_source.id,
+                "start_date_gte": "2024-01-01",
+            },
+        )
 
     assert_response_status_code(response, 200)
     assert len(response.data) == 2
     assert response.data[0]["id"] == expected_date_period.id
 
 
-@pytest.mark.django_db
-def test_list_date_periods_filter_start_date_lte(
-    admin_client, resource, date_period_factory
-):
-    date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2020, month=1, day=1),
-        end_date=None,
-    )
-    date_period2 = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=None,
-        end_date=datetime.date(year=2020, month=1, day=1),
-    )
-
-    url = reverse("date_period-list")
-
-    response = admin_client.get(url, data={"start_date_lte": "2019-01-01"})
-
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
-
-    assert len(response.data) == 1
-    assert response.data[0]["id"] == date_period2.id
-
-
-@pytest.mark.django_db
-def test_list_date_periods_filter_end_date_gte(
-    admin_client, resource, date_period_factory
-):
-    date_period = date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=datetime.date(year=2020, month=1, day=1),
-        end_date=None,
-    )
-    date_period_factory(
-        resource=resource,
-        name="Testperiod",
-        start_date=None,
-        end_date=datetime.date(year=2020, month=1, day=1),
-    )
-
-    url = reverse("date_period-list")
-
-    response = admin_client.get(url, data={"end_date_gte": "2021-01-01"})
-
-    assert response.status_code == 200, "{} {}".format(
-        response.status_code, response.data
-    )
-
-    assert len(response.data) == 1
-    assert response.data[0]["id"] == date_period.id
-
-
 @pytest.mark.django_db
 def test_create_date_period_no_time_span_groups(resource, admin_client):
-    url = reverse("date_period-list")
-
     data = {
         "resource": resource.id,
         "name": "Testperiod",
@@ -276,8 +256,8 @@ def test_create_date_period_no_time_span_groups(resource, admin_client):
     }
 
     response = admin_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        DATE_PERIOD_LIST_URL,
+        data=data,
         content_type="application/json",
     )
 
@@ -294,8 +274,6 @@ def test_create_date_period_no_time_span_groups(resource, admin_client):
 
 @pytest.mark.django_db
 def test_create_date_period_one_time_span_group_one_time_span(resource, admin_client):
-    url = reverse("date_period-list")
-
     data = {
         "resource": resource.id,
         "name": "Testperiod",
@@ -317,8 +295,8 @@ def test_create_date_period_one_time_span_group_one_time_span(resource, admin_cl
     }
 
     response = admin_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        DATE_PERIOD_LIST_URL,
+        data=data,
         content_type="application/json",
     )
 
@@ -326,17 +304,22 @@ def test_create_date_period_one_time_span_group_one_time_span(resource, admin_cl
         response.status_code, response.data
     )
 
-    date_period = DatePeriod.objects.get(pk=response.data["id"])
+    date_period = DatePeriod.objects.prefetch_related(
+        "time_span_groups__time_spans", "time_span_groups__rules"
+    ).get(pk=response.data["id"])
 
     assert date_period.resource == resource
     assert date_period.start_date == datetime.date(year=2020, month=1, day=1)
-    assert date_period.time_span_groups.count() == 1
+    time_span_groups = date_period.time_span_groups.all()
+    assert len(time_span_groups) == 1
 
-    time_span_group = date_period.time_span_groups.first()
-    assert time_span_group.time_spans.count() == 1
-    assert time_span_group.rules.count() == 0
+    time_span_group = time_span_groups[0]
+    time_spans = time_span_group.time_spans.all()
+    rules = time_span_group.rules.all()
+    assert len(time_spans) == 1
+    assert len(rules) == 0
 
-    time_span = time_span_group.time_spans.first()
+    time_span = time_spans[0]
     assert time_span.start_time is None
     assert time_span.end_time is None
     assert time_span.full_day is True
@@ -347,8 +330,6 @@ def test_create_date_period_one_time_span_group_one_time_span(resource, admin_cl
 def test_create_date_period_one_time_span_group_one_time_span_one_rule(
     resource, admin_client
 ):
-    url = reverse("date_period-list")
-
     data = {
         "resource": resource.id,
         "name": "Testperiod",
@@ -377,8 +358,8 @@ def test_create_date_period_one_time_span_group_one_time_span_one_rule(
     }
 
     response = admin_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        DATE_PERIOD_LIST_URL,
+        data=data,
         content_type="application/json",
     )
 
@@ -386,23 +367,28 @@ def test_create_date_period_one_time_span_group_one_time_span_one_rule(
         response.status_code, response.data
     )
 
-    date_period = DatePeriod.objects.get(pk=response.data["id"])
+    date_period = DatePeriod.objects.prefetch_related(
+        "time_span_groups__time_spans", "time_span_groups__rules"
+    ).get(pk=response.data["id"])
 
     assert date_period.resource == resource
     assert date_period.start_date == datetime.date(year=2020, month=1, day=1)
-    assert date_period.time_span_groups.count() == 1
+    time_span_groups = date_period.time_span_groups.all()
+    assert len(time_span_groups) == 1
 
-    time_span_group = date_period.time_span_groups.first()
-    assert time_span_group.time_spans.count() == 1
-    assert time_span_group.rules.count() == 1
+    time_span_group = time_span_groups[0]
+    time_spans = time_span_group.time_spans.all()
+    rules = time_span_group.rules.all()
+    assert len(time_spans) == 1
+    assert len(rules) == 1
 
-    time_span = time_span_group.time_spans.first()
+    time_span = time_spans[0]
     assert time_span.start_time is None
     assert time_span.end_time is None
     assert time_span.full_day is True
     assert time_span.resource_state == State.CLOSED
 
-    rule = time_span_group.rules.first()
+    rule = rules[0]
     assert rule.context == RuleContext.PERIOD
     assert rule.subject == RuleSubject.WEEK
     assert rule.start == 1
@@ -431,7 +417,7 @@ def test_update_date_period_no_time_span_groups(
 
     response = admin_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -483,7 +469,7 @@ def test_update_date_period_keep_one_time_span(
 
     response = admin_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -552,7 +538,7 @@ def test_update_date_period_add_one_time_span(
 
     response = admin_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -579,16 +565,14 @@ def test_update_date_period_add_one_time_span(
 
 @pytest.mark.django_db
 def test_create_time_span_no_group(admin_client):
-    url = reverse("time_span-list")
-
     data = {
         "full_day": True,
         "resource_state": "closed",
     }
 
     response = admin_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        TIME_SPAN_LIST_URL,
+        data=data,
         content_type="application/json",
     )
 
@@ -613,8 +597,6 @@ def test_create_time_span_with_group(
 
     time_span_group = time_span_group_factory(period=date_period)
 
-    url = reverse("time_span-list")
-
     data = {
         "group": time_span_group.id,
         "full_day": True,
@@ -622,8 +604,8 @@ def test_create_time_span_with_group(
     }
 
     response = admin_client.post(
-        url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        TIME_SPAN_LIST_URL,
+        data=data,
         content_type="application/json",
     )
 
@@ -15,11 +15,17 @@ from hours.authentication import (
 from hours.models import SignedAuthEntry
 from users.models import User
 
+AUTH_REQUIRED_URL = reverse("auth_required_test-list")
+
+
+def _signed_auth_header(signing_key, data):
+    signature = calculate_signature(signing_key, join_params(data))
+    return "haukisigned " + urllib.parse.urlencode({**data, "hsa_signature": signature})
+
 
 @pytest.mark.django_db
 def test_get_auth_required_unauthenticated(api_client):
-    url = reverse("auth_required_test-list")
-    response = api_client.get(url)
+    response = api_client.get(AUTH_REQUIRED_URL)
     assert response.status_code == 403
 
 
@@ -29,8 +35,6 @@ def test_get_auth_required_header_invalid_signature(
 ):
     signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     authz_string = (
         "haukisigned"
         " hsa_source=" + data_source.id + "&hsa_username=test_user"
@@ -39,157 +43,77 @@ def test_get_auth_required_header_invalid_signature(
         "&hsa_signature=invalid_signature"
     )
 
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 403
     assert str(response.data["detail"]) == "Invalid hsa_signature"
 
 
 @pytest.mark.django_db
-def test_get_auth_required_header_invalid_created_at(
-    api_client, data_source, signed_auth_key_factory
-):
-    signed_auth_key = signed_auth_key_factory(data_source=data_source)
-
-    url = reverse("auth_required_test-list")
-
-    data = {
-        "hsa_source": data_source.id,
-        "hsa_username": "test_user",
-        "hsa_created_at": "2030-01-01T10:10:10.000Z",
-        "hsa_valid_until": "2030-01-01T10:20:10.000Z",
-    }
-
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
-
-    assert response.status_code == 403
-    assert str(response.data["detail"]) == "Invalid hsa_created_at"
-
-
-@pytest.mark.django_db
-def test_get_auth_required_header_timezone_missing_created_at(
-    api_client, data_source, signed_auth_key_factory
-):
-    signed_auth_key = signed_auth_key_factory(data_source=data_source)
-
-    url = reverse("auth_required_test-list")
-
-    now = datetime.datetime.utcnow()
-
-    data = {
-        "hsa_source": data_source.id,
-        "hsa_username": "test_user",
-        "hsa_created_at": now.isoformat(),
-        "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat()
-        + "-04:00",
-    }
-
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
-
-    assert response.status_code == 403
-    assert str(response.data["detail"]) == "Invalid hsa_created_at"
-
-
-@pytest.mark.django_db
-def test_get_auth_required_header_invalid_valid_until(
-    api_client, data_source, signed_auth_key_factory
-):
-    signed_auth_key = signed_auth_key_factory(data_source=data_source)
-
-    url = reverse("auth_required_test-list")
-
-    data = {
-        "hsa_source": data_source.id,
-        "hsa_username": "test_user",
-        "hsa_created_at": "2020-01-01T10:10:10.000Z",
-        "hsa_valid_until": "2000-01-01T10:20:10.000Z",
-    }
-
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
-
-    assert response.status_code == 403
-    assert str(response.data["detail"]) == "Invalid hsa_valid_until"
-
-
-@pytest.mark.django_db
-def test_get_auth_required_header_timezone_missing_valid_until(
-    api_client, data_source, signed_auth_key_factory
+@pytest.mark.parametrize(
+    "created_at, valid_until, expected_detail",
+    [
+        pytest.param(
+            "2030-01-01T10:10:10.000Z",
+            "2030-01-01T10:20:10.000Z",
+            "Invalid hsa_created_at",
+            id="invalid_created_at",
+        ),
+        pytest.param(
+            "{now}",
+            "{in_ten_minutes}-04:00",
+            "Invalid hsa_created_at",
+            id="timezone_missing_created_at",
+        ),
+        pytest.param(
+            "2020-01-01T10:10:10.000Z",
+            "2000-01-01T10:20:10.000Z",
+            "Invalid hsa_valid_until",
+            id="invalid_valid_until",
+        ),
+        pytest.param(
+            "{now}Z",
+            "{in_ten_minutes}",
+            "Invalid hsa_valid_until",
+            id="timezone_missing_valid_until",
+        ),
+        pytest.param(
+            "{now}",
+            "{in_ten_minutes}",
+            "Invalid hsa_created_at",
+            id="timezone_missing_created_at_and_valid_until",
+        ),
+    ],
+)
+def test_get_auth_required_header_invalid_timestamps(
+    api_client,
+    data_source,
+    signed_auth_key_factory,
+    created_at,
+    valid_until,
+    expected_detail,
 ):
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
-
-    data = {
-        "hsa_source": data_source.id,
-        "hsa_username": "test_user",
-        "hsa_created_at": now.isoformat() + "Z",
-        "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat(),
+    timestamps = {
+        "now": now.isoformat(),
+        "in_ten_minutes": (now + datetime.timedelta(minutes=10)).isoformat(),
     }
 
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
-
-    assert response.status_code == 403
-    assert str(response.data["detail"]) == "Invalid hsa_valid_until"
-
-
-@pytest.mark.django_db
-def test_get_auth_required_header_timezone_missing_created_at_and_valid_until(
-    api_client, data_source, signed_auth_key_factory
-):
-    signed_auth_key = signed_auth_key_factory(data_source=data_source)
-
-    url = reverse("auth_required_test-list")
-
-    now = datetime.datetime.utcnow()
-
     data = {
         "hsa_source": data_source.id,
         "hsa_username": "test_user",
-        "hsa_created_at": now.isoformat(),
-        "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat(),
+        "hsa_created_at": created_at.format(**timestamps),
+        "hsa_valid_until": valid_until.format(**timestamps),
     }
 
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 403
-    assert str(response.data["detail"]) == "Invalid hsa_created_at"
+    assert str(response.data["detail"]) == expected_detail
 
 
 @pytest.mark.django_db
@@ -198,8 +122,6 @@ def test_get_auth_required_header_authenticated(
 ):
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -209,14 +131,9 @@ def test_get_auth_required_header_authenticated(
         "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat() + "Z",
     }
 
-    source_string = join_params(data)
-    signature = calculate_signature(signed_auth_key.signing_key, source_string)
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -230,8 +147,6 @@ def test_join_user_to_organization(
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
     org = organization_factory(data_source=data_source, origin_id=1234)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -242,13 +157,9 @@ def test_join_user_to_organization(
         "hsa_organization": org.id,
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -274,8 +185,6 @@ def test_join_user_to_organization_existing_user(
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
     org = organization_factory(data_source=data_source, origin_id=1234)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -286,13 +195,9 @@ def test_join_user_to_organization_existing_user(
         "hsa_organization": org.id,
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -320,8 +225,6 @@ def test_join_user_to_organization_existing_user_and_organisation(
 
     user.organization_memberships.add(org)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -332,13 +235,9 @@ def test_join_user_to_organization_existing_user_and_organisation(
         "hsa_organization": org.id,
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
-
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -354,8 +253,6 @@ def test_join_user_to_organization_invalid_org(
 ):
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -366,13 +263,9 @@ def test_join_user_to_organization_invalid_org(
         "hsa_organization": "test:2345",
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -388,8 +281,6 @@ def test_signed_auth_entry_not_invalidated(
 ):
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
     valid_until = now + datetime.timedelta(minutes=10)
 
@@ -407,7 +298,7 @@ def test_signed_auth_entry_not_invalidated(
     )
 
     # Check that auth works
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -420,7 +311,7 @@ def test_signed_auth_entry_not_invalidated(
     )
 
     # Check that auth still works
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -430,8 +321,6 @@ def test_signed_auth_entry_not_invalidated(
 def test_invalidate_signature_success_header_params(
     api_client, data_source, signed_auth_key_factory
 ):
-    url = reverse("auth_required_test-list")
-
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
     now = datetime.datetime.utcnow()
@@ -452,7 +341,7 @@ def test_invalidate_signature_success_header_params(
     )
 
     # Check that auth works
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -470,7 +359,7 @@ def test_invalidate_signature_success_header_params(
     assert signed_auth_entry.valid_until == valid_until.replace(tzinfo=UTC)
 
     # Verify that the auth no longer works
-    response = api_client.get(url, HTTP_AUTHORIZATION=authz_string)
+    response = api_client.get(AUTH_REQUIRED_URL, HTTP_AUTHORIZATION=authz_string)
 
     assert response.status_code == 403
 
@@ -481,8 +370,6 @@ def test_invalidate_signature_success_query_params(
 ):
     signed_auth_key = signed_auth_key_factory(data_source=data_source)
 
-    url = reverse("auth_required_test-list")
-
     now = datetime.datetime.utcnow()
 
     data = {
@@ -497,7 +384,7 @@ def test_invalidate_signature_success_query_params(
     authz_string = "?" + urllib.parse.urlencode({**data, "hsa_signature": signature})
 
     # Check that auth works
-    response = api_client.get(f"{url}{authz_string}")
+    response = api_client.get(f"{AUTH_REQUIRED_URL}{authz_string}")
 
     assert response.status_code == 200
     assert response.data["username"] == "test_user"
@@ -510,7 +397,7 @@ def test_invalidate_signature_success_query_params(
     assert response.data == {"success": True}
 
     # Verify that the auth no longer works
-    response = api_client.get(f"{url}{authz_string}")
+    response = api_client.get(f"{AUTH_REQUIRED_URL}{authz_string}")
 
     assert response.status_code == 403
 
@@ -539,11 +426,7 @@ def test_invalidate_signature_invalid_params(
         "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat() + "Z",
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
     # Invalidate the signature
     invalidate_url = reverse("invalidate_hauki_auth_signature")
@@ -567,11 +450,7 @@ def test_invalidate_signature_missing_timezone(
         "hsa_valid_until": (now + datetime.timedelta(minutes=10)).isoformat(),
     }
 
-    signature = calculate_signature(signed_auth_key.signing_key, join_params(data))
-
-    authz_string = "haukisigned " + urllib.parse.urlencode(
-        {**data, "hsa_signature": signature}
-    )
+    authz_string = _signed_auth_header(signed_auth_key.signing_key, data)
 
     # Invalidate the signature
     invalidate_url = reverse("invalidate_hauki_auth_signature")
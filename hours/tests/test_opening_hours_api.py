@@ -3,18 +3,18 @@ import datetime
 import pytest
 from django.urls import reverse
 
+OPENING_HOURS_LIST_URL = reverse("opening_hours-list")
+
 
 @pytest.mark.django_db
 def test_opening_hours_empty(admin_client):
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -35,15 +35,13 @@ def test_opening_hours_date_period_no_opening_hours(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -74,15 +72,13 @@ def test_opening_hours_date_period_with_hours(
     time_span_group = time_span_group_factory(period=period)
     time_span_factory(group=time_span_group)
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -122,15 +118,13 @@ def test_opening_hours_date_period_with_hours_and_rule(
         frequency_modifier="even",
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
     with django_assert_num_queries(9):
         response = admin_client.get(
-            url,
+            OPENING_HOURS_LIST_URL,
             data=data,
             content_type="application/json",
         )
@@ -158,15 +152,13 @@ def test_opening_hours_two_resources_one_date_period(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -201,15 +193,13 @@ def test_opening_hours_two_resources_two_date_periods(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -234,15 +224,13 @@ def test_opening_hours_date_period_start_date_empty(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -267,15 +255,13 @@ def test_opening_hours_date_period_end_date_empty(
         end_date=None,
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -300,15 +286,13 @@ def test_opening_hours_date_period_start_and_end_date_empty(
         end_date=None,
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -339,15 +323,13 @@ def test_opening_hours_date_period_with_hours_start_and_end_date_empty(
     time_span_group = time_span_group_factory(period=period)
     time_span_factory(group=time_span_group)
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -386,15 +368,13 @@ def test_opening_hours_date_period_with_hours_and_rule_start_and_end_date_empty(
         frequency_modifier="even",
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -447,8 +427,6 @@ def test_opening_hours_data_source_filter_two_resources(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
@@ -456,7 +434,7 @@ def test_opening_hours_data_source_filter_two_resources(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -507,8 +485,6 @@ def test_opening_hours_data_source_filter_two_resources_different_data_source(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
@@ -516,7 +492,7 @@ def test_opening_hours_data_source_filter_two_resources_different_data_source(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -567,8 +543,6 @@ def test_opening_hours_data_source_filter_child_has_data_source(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
@@ -576,7 +550,7 @@ def test_opening_hours_data_source_filter_child_has_data_source(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -632,8 +606,6 @@ def test_opening_hours_data_source_filter_child_doesnt_have_data_source(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
@@ -641,7 +613,7 @@ def test_opening_hours_data_source_filter_child_doesnt_have_data_source(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -678,8 +650,6 @@ def test_opening_hours_resource_filter_two_resources(
         end_date=datetime.date(year=2020, month=12, day=31),
     )
 
-    url = reverse("opening_hours-list")
-
     data = {
         "start_date": "2020-11-01",
         "end_date": "2020-11-30",
@@ -687,7 +657,7 @@ def test_opening_hours_resource_filter_two_resources(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -707,7 +677,7 @@ def test_opening_hours_resource_filter_two_resources(
     }
 
     response = admin_client.get(
-        url,
+        OPENING_HOURS_LIST_URL,
         data=data,
         content_type="application/json",
     )
@@ -1,12 +1,12 @@
 import pytest
 from django.urls import reverse
 
+RESOURCE_LIST_URL = reverse("resource-list")
+
 
 @pytest.mark.django_db
 def test_list_resources_empty(admin_client):
-    url = reverse("resource-list")
-
-    response = admin_client.get(url)
+    response = admin_client.get(RESOURCE_LIST_URL)
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -19,9 +19,7 @@ def test_list_resources_empty(admin_client):
 def test_list_resources_one_resource(admin_client, resource_factory):
     resource = resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url)
+    response = admin_client.get(RESOURCE_LIST_URL)
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -36,9 +34,7 @@ def test_list_resources_multiple_resources(admin_client, resource_factory):
     resource = resource_factory()
     resource2 = resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url)
+    response = admin_client.get(RESOURCE_LIST_URL)
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -60,9 +56,7 @@ def test_list_resources_data_source_filter_none_of_two_match(
     resource_factory()
     resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"data_source": data_source.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"data_source": data_source.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -82,9 +76,7 @@ def test_list_resources_data_source_filter_one_of_two_match(
 
     resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"data_source": data_source.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"data_source": data_source.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -109,9 +101,7 @@ def test_list_resources_data_source_filter_two_of_two_match(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"data_source": data_source.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"data_source": data_source.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -131,9 +121,7 @@ def test_list_resources_origin_id_exists_filter_false_all_match(
     resource = resource_factory()
     resource2 = resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": False})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": False})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -156,9 +144,7 @@ def test_list_resources_origin_id_exists_filter_false_one_matches(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": False})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": False})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -182,9 +168,7 @@ def test_list_resources_origin_id_exists_filter_false_none_match(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": False})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": False})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -204,9 +188,7 @@ def test_list_resources_origin_id_exists_filter_true_all_match(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": True})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": True})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -229,9 +211,7 @@ def test_list_resources_origin_id_exists_filter_true_one_matches(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": True})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": True})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -253,9 +233,7 @@ def test_list_resources_origin_id_exists_filter_true_none_match(
     resource_factory()
     resource_factory()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"origin_id_exists": True})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"origin_id_exists": True})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -276,10 +254,9 @@ def test_list_resources_data_source_and_origin_id_exists_filter_none_match(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source2.id, "origin_id_exists": True}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source2.id, "origin_id_exists": True},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -300,10 +277,9 @@ def test_list_resources_data_source_and_origin_id_exists_filter_all_match(
     resource2 = resource_factory()
     resource_origin_factory(resource=resource2, data_source=data_source)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": True}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": True},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -332,10 +308,9 @@ def test_data_source_and_origin_id_exists_two_data_sources(
     resource_origin_factory(resource=resource2, data_source=data_source)
     resource_origin_factory(resource=resource2, data_source=data_source2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": True}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": True},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -363,10 +338,9 @@ def test_data_source_and_origin_id_exists_two_data_sources_on_other(
     resource_origin_factory(resource=resource2, data_source=data_source)
     resource_origin_factory(resource=resource2, data_source=data_source2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": True}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": True},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -394,10 +368,9 @@ def test_data_source_and_origin_id_exists_false_two_data_sources_on_other(
     resource_origin_factory(resource=resource2, data_source=data_source)
     resource_origin_factory(resource=resource2, data_source=data_source2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": False}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": False},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -421,10 +394,9 @@ def test_data_source_and_origin_id_exists_false_data_sources_in_parent(
     resource2 = resource_factory()
     resource.children.add(resource2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": False}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": False},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -453,10 +425,9 @@ def test_data_source_and_origin_id_exists_false_different_data_source_in_child(
     resource_origin_factory(resource=resource, data_source=data_source2)
     resource.children.add(resource2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": False}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": False},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -485,10 +456,9 @@ def test_data_source_and_origin_id_exists_true_different_data_source_in_child(
     resource_origin_factory(resource=resource, data_source=data_source2)
     resource.children.add(resource2)
 
-    url = reverse("resource-list")
-
     response = admin_client.get(
-        url, data={"data_source": data_source.id, "origin_id_exists": True}
+        RESOURCE_LIST_URL,
+        data={"data_source": data_source.id, "origin_id_exists": True},
     )
 
     assert response.status_code == 200, "{} {}".format(
@@ -509,9 +479,7 @@ def test_list_resources_parent_and_child_filter_match(admin_client, resource_fac
     resource_2.parents.add(resource_1)
     resource_2.save()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"parent": resource_1.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"parent": resource_1.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -523,7 +491,7 @@ def test_list_resources_parent_and_child_filter_match(admin_client, resource_fac
 
     assert resource_ids == {resource_2.id}
 
-    response = admin_client.get(url, data={"child": resource_2.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"child": resource_2.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -545,9 +513,7 @@ def test_list_resources_parent_and_child_filter_no_match(
     resource_1.parents.add(resource_2)
     resource_1.save()
 
-    url = reverse("resource-list")
-
-    response = admin_client.get(url, data={"parent": resource_1.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"parent": resource_1.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -555,7 +521,7 @@ def test_list_resources_parent_and_child_filter_no_match(
 
     assert response.data["count"] == 0
 
-    response = admin_client.get(url, data={"child": resource_2.id})
+    response = admin_client.get(RESOURCE_LIST_URL, data={"child": resource_2.id})
 
     assert response.status_code == 200, "{} {}".format(
         response.status_code, response.data
@@ -582,28 +548,26 @@ def test_list_resources_filter_by_multiple_resource_ids(
     resource_origin_factory(resource=resource, data_source=data_source2, origin_id=2345)
     resources.append(resource)
 
-    url = reverse("resource-list")
-
     resource_ids = ",".join(
         [
             "",
             ":",
             str(resources[0].id),
             "{}:{}".format(
-                resources[2].origins.first().data_source.id,
+                resources[2].origins.first().data_source_id,
                 resources[2].origins.first().origin_id,
             ),
             f" {resources[5].id} ",
             "{}:{}".format(
-                resources[8].origins.first().data_source.id,
+                resources[8].origins.first().data_source_id,
                 resources[8].origins.first().origin_id,
             ),
             "{}:{}".format(
-                resources[9].origins.first().data_source.id,
+                resources[9].origins.first().data_source_id,
                 resources[9].origins.first().origin_id,
             ),
             "{}:{}".format(
-                resources[9].origins.last().data_source.id,
+                resources[9].origins.last().data_source_id,
                 resources[9].origins.last().origin_id,
             ),
             "nonsensical value",
@@ -612,7 +576,7 @@ def test_list_resources_filter_by_multiple_resource_ids(
     )
 
     response = admin_client.get(
-        url,
+        RESOURCE_LIST_URL,
         data={
             "resource_ids": resource_ids,
             "data_source": data_source.id,
@@ -1,9 +1,7 @@
 import datetime
-import json
 import re
 
 import pytest
-from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 from django.utils import translation
 
@@ -394,7 +392,7 @@ def test_text_updates_when_date_period_is_added_via_api(resource, admin_client):
 
     response = admin_client.post(
         url,
-        data=json.dumps(date_period_data, cls=DjangoJSONEncoder),
+        data=date_period_data,
         content_type="application/json",
     )
 
@@ -475,7 +473,7 @@ def test_text_updates_when_timespan_is_removed_via_api(resource, admin_client):
 
     response = admin_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -1,8 +1,6 @@
 import datetime
-import json
 
 import pytest
-from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 
 from hours.enums import State
@@ -48,7 +46,7 @@ def test_create_time_span_direct(
 
     response = admin_client.post(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -110,7 +108,7 @@ def test_create_time_span_nested_using_api_endpoint(
 
     response = admin_client.patch(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -229,7 +227,7 @@ def test_create_time_span_same_day_end_time(
 
     response = admin_client.post(
         url,
-        data=json.dumps(data, cls=DjangoJSONEncoder),
+        data=data,
         content_type="application/json",
     )
 
@@ -1,4 +1,5 @@
 from hours.enums import RuleContext, RuleSubject
+from hours.models import TimeSpan
 from hours.tests.conftest import RuleFactory, TimeSpanFactory, TimeSpanGroupFactory
 
 
@@ -41,7 +42,13 @@ class TimeSpanGroupBuilder:
         if self.rule is not None:
             RuleFactory(group=time_span_group, **self.rule)
 
-        for time_span in self.time_spans:
-            TimeSpanFactory(group=time_span_group, **time_span)
+        TimeSpan.objects.bulk_create(
+            [
+                TimeSpanFactory.build(group=time_span_group, **time_span)
+                for time_span in self.time_spans
+            ]
+        )
+        # bulk_create doesn't send post_save, which would update these
+        self.date_period.resource.update_denormalized_date_periods_data()
 
         return time_span_group